@@ -21,7 +21,7 @@ echo "Initializing database..."
 python -m src.database.init_db
 
 # Train model (if not exists)
-if [ ! -f "models/football_model.pkl" ]; then
+if [ ! -f "models/football_model.ubj" ] && [ ! -f "models/football_model.pkl" ]; then
     echo "Training model..."
     python -m src.models.train
 else
@@ -6,10 +6,15 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import logging
+import os
 from sqlalchemy.orm import Session
 from sqlalchemy import create_engine
 from pathlib import Path
 
+# Service modules log through `logging`; LOG_LEVEL=DEBUG shows per-request detail
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format="%(message)s")
+
 from src.database.db import get_db, DATABASE_URL
 from src.database.models import Base
 
@@ -99,6 +104,13 @@ class SafePicksResponse(BaseModel):
     confidence: float
 
 
+@app.on_event("shutdown")
+async def close_match_fetcher():
+    """Release the match fetcher's pooled connections"""
+    await match_fetcher.aclose()
+    match_fetcher.close()
+
+
 # API Endpoints
 @app.get("/")
 async def root():
@@ -289,7 +301,7 @@ async def get_safe_picks_today(db: Session = Depends(get_db)):
     
     try:
         # Fetch today's matches
-        matches = match_fetcher.get_today_matches()
+        matches = await match_fetcher.aget_today_matches()
         print(f"📊 Fetched {len(matches)} matches from match fetcher")
         print(f"🔑 API Key status: {'SET' if match_fetcher.api_key else 'NOT SET'}")
         
@@ -467,7 +479,7 @@ async def get_raw_predictions(db: Session = Depends(get_db)):
         return {"raw_predictions": [], "message": "Model not trained. Using fallback predictions in main endpoint."}
     
     try:
-        matches = match_fetcher.get_today_matches()
+        matches = await match_fetcher.aget_today_matches()
         raw = prediction_service.get_raw_predictions(matches)
         return {"raw_predictions": raw}
     except Exception as e:
@@ -625,7 +637,7 @@ async def test_api_connection():
 async def get_matches_today(db: Session = Depends(get_db)):
     """Get all matches being considered today"""
     try:
-        matches = match_fetcher.get_today_matches()
+        matches = await match_fetcher.aget_today_matches()
         
         # Diagnostic info
         api_key_set = bool(match_fetcher.api_key)
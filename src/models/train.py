@@ -1,34 +1,39 @@
 """
 Train ML model for football predictions
-Uses XGBoost with fallback to RandomForest
+Uses XGBoost with fallback to LightGBM, then RandomForest
 """
 import pandas as pd
 import numpy as np
 from pathlib import Path
+import os
+import sys
+import importlib.util
 import joblib
 import json
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 import warnings
 warnings.filterwarnings('ignore')
 
-try:
-    import xgboost as xgb
-    XGBOOST_AVAILABLE = True
-except ImportError:
-    XGBOOST_AVAILABLE = False
+# XGBoost / scikit-learn are imported lazily (training and model loading only) so the
+# inference-only import path doesn't pay their startup cost. find_spec doesn't import them.
+XGBOOST_AVAILABLE = importlib.util.find_spec('xgboost') is not None
 
-# Optional scikit-learn (only if XGBoost unavailable)
-try:
-    from sklearn.ensemble import RandomForestClassifier
-    from sklearn.model_selection import train_test_split
-    from sklearn.metrics import accuracy_score, precision_score, recall_score, roc_auc_score
-    from sklearn.preprocessing import StandardScaler
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
+# Optional LightGBM (first fallback if XGBoost unavailable)
+LGB_AVAILABLE = importlib.util.find_spec('lightgbm') is not None
+
+# Optional scikit-learn (RandomForest last-resort fallback)
+SKLEARN_AVAILABLE = importlib.util.find_spec('sklearn') is not None
+if not SKLEARN_AVAILABLE:
     # Fallback implementations if sklearn not available
     print("⚠️ Warning: scikit-learn not available. Using simple implementations.")
 
+# Optional numba (JIT for the feature-packing kernel; pure Python otherwise)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 BASE_DIR = Path(__file__).parent.parent.parent
 MODEL_DIR = BASE_DIR / "models"
 # Create models directory if it doesn't exist (handle permission errors gracefully)
@@ -40,9 +45,144 @@ except PermissionError:
     MODEL_DIR.mkdir(exist_ok=True, parents=True)
     print(f"⚠️ Warning: Could not create models directory in /app, using /tmp/models instead")
 
-MODEL_PATH = MODEL_DIR / "football_model.pkl"
+MODEL_PATH = MODEL_DIR / "football_model.pkl"  # RandomForest / legacy pickled models
+XGB_MODEL_PATH = MODEL_DIR / "football_model.ubj"  # XGBoost native binary format
+LGB_MODEL_PATH = MODEL_DIR / "football_model_lgb.txt"  # LightGBM native text format
 SCALER_PATH = MODEL_DIR / "scaler.pkl"
 FEATURES_PATH = MODEL_DIR / "feature_names.json"
+MODEL_META_PATH = MODEL_DIR / "model_meta.json"  # e.g. early-stopping best iteration
+
+FEATURE_NAMES = (
+    'home_goals_scored_5', 'home_goals_conceded_5',
+    'away_goals_scored_5', 'away_goals_conceded_5',
+    'home_form_pct', 'away_form_pct',
+    'home_xg', 'away_xg',
+    'home_sot_avg', 'away_sot_avg',
+    'home_position', 'away_position', 'table_gap',
+    'pressure_index',
+    'is_derby', 'is_must_win', 'fixture_congestion',
+    'home_odds', 'draw_odds', 'away_odds',
+    'tier_EPL', 'tier_LaLiga', 'tier_Bundesliga',
+    'tier_SerieA', 'tier_Ligue1', 'tier_Eredivisie',
+)
+N_FEATURES = len(FEATURE_NAMES)
+# XGBoost's hist method bins features into <=256 buckets, so float64 buys no accuracy
+FEATURE_DTYPE = np.float32
+
+# DataFrame column and default for each non-tier feature, in FEATURE_NAMES order.
+# Column names follow pd.json_normalize of the match dicts.
+FEATURE_COLUMNS = (
+    ('home_form.goals_scored_5', 0), ('home_form.goals_conceded_5', 0),
+    ('away_form.goals_scored_5', 0), ('away_form.goals_conceded_5', 0),
+    ('home_form.form_percentage', 0.5), ('away_form.form_percentage', 0.5),
+    ('home_xg', 1.5), ('away_xg', 1.5),
+    ('home_form.shots_on_target_avg', 4.0), ('away_form.shots_on_target_avg', 4.0),
+    ('home_position', 10), ('away_position', 10), ('table_gap', 0),
+    ('pressure_index', 0.5),
+    ('is_derby', False), ('is_must_win', False), ('fixture_congestion', 7),
+    ('home_odds', 2.0), ('draw_odds', 3.0), ('away_odds', 2.0),
+)
+
+# League tiers with a one-hot column (any other tier encodes as all zeros)
+LEAGUE_TIERS = ('EPL', 'LaLiga', 'Bundesliga', 'SerieA', 'Ligue1', 'Eredivisie')
+TIER_INDEX = {tier: i for i, tier in enumerate(LEAGUE_TIERS)}
+TIER_OFFSET = N_FEATURES - len(LEAGUE_TIERS)
+
+
+def _pack_row(out, home_gs, home_gc, away_gs, away_gc, home_form_pct, away_form_pct,
+              home_xg, away_xg, home_sot, away_sot, home_pos, away_pos, table_gap,
+              pressure, is_derby, is_must_win, congestion, home_odds, draw_odds, away_odds,
+              tier_idx):
+    """Write one match's numeric features (FEATURE_NAMES order) into a row buffer"""
+    out[0] = home_gs
+    out[1] = home_gc
+    out[2] = away_gs
+    out[3] = away_gc
+    out[4] = home_form_pct
+    out[5] = away_form_pct
+    out[6] = home_xg
+    out[7] = away_xg
+    out[8] = home_sot
+    out[9] = away_sot
+    out[10] = home_pos
+    out[11] = away_pos
+    out[12] = table_gap
+    out[13] = pressure
+    out[14] = is_derby
+    out[15] = is_must_win
+    out[16] = congestion
+    out[17] = home_odds
+    out[18] = draw_odds
+    out[19] = away_odds
+    for i in range(TIER_OFFSET, N_FEATURES):
+        out[i] = 0.0
+    if tier_idx >= 0:
+        out[TIER_OFFSET + tier_idx] = 1.0
+
+
+if NUMBA_AVAILABLE:
+    _pack_row = numba.njit(cache=True, boundscheck=False)(_pack_row)
+
+
+def _build_extract_row_source() -> str:
+    """
+    Generate a straight-line _extract_row(match_data, out) for the fixed feature schema:
+    one dict lookup + store per feature, no loops or per-call dict/list building.
+    With numba the numeric packing is delegated to the JIT-compiled _pack_row.
+    """
+    args = []
+    for column, default in FEATURE_COLUMNS:
+        group, _, key = column.rpartition('.')
+        source = {'home_form': 'home_form', 'away_form': 'away_form', '': 'match_data'}[group]
+        lookup = f"{source}.get({key!r}, {default!r})"
+        args.append(f"(1.0 if {lookup} else 0.0)" if isinstance(default, bool) else f"float({lookup})")
+    tier = "TIER_INDEX.get(match_data.get('league_tier', 'other'), -1)"
+    
+    lines = [
+        "def _extract_row(match_data, out):",
+        "    home_form = match_data.get('home_form', {})",
+        "    away_form = match_data.get('away_form', {})",
+    ]
+    if NUMBA_AVAILABLE:
+        lines.append(f"    _pack_row(out, {', '.join(args)}, {tier})")
+    else:
+        lines += [f"    out[{i}] = {arg}" for i, arg in enumerate(args)]
+        lines += [
+            f"    out[{TIER_OFFSET}:] = 0.0",
+            f"    tier_idx = {tier}",
+            "    if tier_idx >= 0:",
+            f"        out[{TIER_OFFSET} + tier_idx] = 1.0",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+# Kept for debugging: print(_EXTRACT_ROW_SOURCE) shows exactly what runs per match
+_EXTRACT_ROW_SOURCE = _build_extract_row_source()
+_namespace = {'TIER_INDEX': TIER_INDEX, '_pack_row': _pack_row}
+exec(compile(_EXTRACT_ROW_SOURCE, '<generated _extract_row>', 'exec'), _namespace)
+_extract_row = _namespace['_extract_row']
+del _namespace
+
+
+def _as_c32(X: np.ndarray) -> np.ndarray:
+    """Row-major float32 view of X, so XGBoost doesn't copy/transpose it internally"""
+    if X.dtype != FEATURE_DTYPE or not X.flags['C_CONTIGUOUS']:
+        # Typical source: F-ordered arrays from DataFrame.values / column slicing
+        print(f"⚠️ Warning: feature matrix is {X.dtype}, "
+              f"{'C' if X.flags['C_CONTIGUOUS'] else 'non-C'}-ordered; copying to C-ordered float32")
+    return np.ascontiguousarray(X, dtype=FEATURE_DTYPE)
+
+
+def _is_booster(model) -> bool:
+    """True for a native xgboost.Booster; never imports xgboost itself"""
+    xgb = sys.modules.get('xgboost')
+    return xgb is not None and isinstance(model, xgb.Booster)
+
+
+def _is_lgb_booster(model) -> bool:
+    """True for a native lightgbm.Booster; never imports lightgbm itself"""
+    lgb = sys.modules.get('lightgbm')
+    return lgb is not None and isinstance(model, lgb.Booster)
 
 
 class FootballPredictor:
@@ -50,188 +190,142 @@ class FootballPredictor:
     
     def __init__(self):
         self.model = None
-        # Only create scaler if sklearn is available
-        if SKLEARN_AVAILABLE:
-            self.scaler = StandardScaler()
-        else:
-            self.scaler = None  # Will use simple normalization instead
+        # Tree models (XGBoost/RandomForest) are invariant to per-feature rescaling,
+        # so no scaler is fitted. Only set when loading artifacts from older trainings.
+        self.scaler = None
         self.feature_names = []
-        self._scaler_mean = None  # For simple normalization fallback
+        self._scaler_mean = None  # Legacy simple-normalization stats
         self._scaler_std = None
+        # Reused feature row for single-match inference (avoids a fresh array per predict)
+        self._buf = np.empty((1, N_FEATURES), dtype=FEATURE_DTYPE)
+        # Last useful boosting round from early stopping; trees after it are skipped at inference
+        self.best_iteration = None
         
     def extract_features(self, match_data: Dict) -> np.ndarray:
         """Extract features from match data for ML model"""
-        features = []
-        
-        # Team performance features
-        home_form = match_data.get('home_form', {})
-        away_form = match_data.get('away_form', {})
-        
-        # Goals scored/conceded (last 5 matches)
-        features.extend([
-            home_form.get('goals_scored_5', 0),
-            home_form.get('goals_conceded_5', 0),
-            away_form.get('goals_scored_5', 0),
-            away_form.get('goals_conceded_5', 0),
-        ])
-        
-        # Form percentage
-        features.extend([
-            home_form.get('form_percentage', 0.5),
-            away_form.get('form_percentage', 0.5),
-        ])
-        
-        # Expected goals
-        features.extend([
-            match_data.get('home_xg', 1.5),
-            match_data.get('away_xg', 1.5),
-        ])
-        
-        # Shots on target
-        features.extend([
-            home_form.get('shots_on_target_avg', 4.0),
-            away_form.get('shots_on_target_avg', 4.0),
-        ])
-        
-        # League context
-        features.extend([
-            match_data.get('home_position', 10),
-            match_data.get('away_position', 10),
-            match_data.get('table_gap', 0),
-        ])
-        
-        # Pressure index (0-1)
-        features.append(match_data.get('pressure_index', 0.5))
-        
-        # Match importance
-        features.extend([
-            1.0 if match_data.get('is_derby', False) else 0.0,
-            1.0 if match_data.get('is_must_win', False) else 0.0,
-            match_data.get('fixture_congestion', 7),  # Days since last match
-        ])
-        
-        # Odds
-        features.extend([
-            match_data.get('home_odds', 2.0),
-            match_data.get('draw_odds', 3.0),
-            match_data.get('away_odds', 2.0),
-        ])
-        
-        # League tier encoding (one-hot like)
-        tier = match_data.get('league_tier', 'other')
-        tier_encoding = {
-            'EPL': [1, 0, 0, 0, 0, 0],
-            'LaLiga': [0, 1, 0, 0, 0, 0],
-            'Bundesliga': [0, 0, 1, 0, 0, 0],
-            'SerieA': [0, 0, 0, 1, 0, 0],
-            'Ligue1': [0, 0, 0, 0, 1, 0],
-            'Eredivisie': [0, 0, 0, 0, 0, 1],
-        }
-        features.extend(tier_encoding.get(tier, [0, 0, 0, 0, 0, 0]))
-        
-        self.feature_names = [
-            'home_goals_scored_5', 'home_goals_conceded_5',
-            'away_goals_scored_5', 'away_goals_conceded_5',
-            'home_form_pct', 'away_form_pct',
-            'home_xg', 'away_xg',
-            'home_sot_avg', 'away_sot_avg',
-            'home_position', 'away_position', 'table_gap',
-            'pressure_index',
-            'is_derby', 'is_must_win', 'fixture_congestion',
-            'home_odds', 'draw_odds', 'away_odds',
-            'tier_EPL', 'tier_LaLiga', 'tier_Bundesliga',
-            'tier_SerieA', 'tier_Ligue1', 'tier_Eredivisie',
-        ]
-        
-        return np.array(features).reshape(1, -1)
+        features = np.empty((1, N_FEATURES), dtype=FEATURE_DTYPE)
+        self._extract_row(match_data, features[0])
+        self.feature_names = list(FEATURE_NAMES)
+        return features
+    
+    # Write the features of one match into a preallocated row view
+    _extract_row = staticmethod(_extract_row)
     
-    def train(self, training_data: List[Dict], target_variable: str = "outcome"):
+    @staticmethod
+    def _targets(df: pd.DataFrame, target_variable: str) -> np.ndarray:
+        """Target: 1 if prediction correct, 0 otherwise"""
+        # For now, predict probability of safe markets
+        if target_variable == "over_0.5_goals":
+            y = df['total_goals'].fillna(0) > 0.5 if 'total_goals' in df else np.zeros(len(df))
+        elif target_variable == "home_win":
+            y = df['result'] == 'home' if 'result' in df else np.zeros(len(df))
+        else:
+            y = df['target'].fillna(0.5) if 'target' in df else np.full(len(df), 0.5)
+        return np.asarray(y, dtype=FEATURE_DTYPE)
+    
+    def train(self, training_data: Union[pd.DataFrame, List[Dict]], target_variable: str = "outcome"):
         """
         Train the model on historical data
         
         Args:
-            training_data: List of match dictionaries with outcomes
+            training_data: DataFrame with one column per field (nested form stats as
+                'home_form.goals_scored_5' etc.), or a list of match dictionaries
             target_variable: What to predict (e.g., "over_0.5_goals", "home_win")
         """
-        # Convert to DataFrame
-        features_list = []
-        targets = []
+        df = training_data if isinstance(training_data, pd.DataFrame) else pd.json_normalize(training_data)
         
-        for match in training_data:
-            feat = self.extract_features(match)
-            features_list.append(feat[0])
-            
-            # Target: 1 if prediction correct, 0 otherwise
-            # For now, predict probability of safe markets
-            if target_variable == "over_0.5_goals":
-                target = 1.0 if match.get('total_goals', 0) > 0.5 else 0.0
-            elif target_variable == "home_win":
-                target = 1.0 if match.get('result') == 'home' else 0.0
-            else:
-                target = match.get('target', 0.5)
-            
-            targets.append(target)
+        # Build the feature matrix in one C-contiguous allocation, column by column
+        n = len(df)
+        X = np.empty((n, N_FEATURES), dtype=FEATURE_DTYPE)
+        for j, (column, default) in enumerate(FEATURE_COLUMNS):
+            X[:, j] = df[column].fillna(default).to_numpy(dtype=FEATURE_DTYPE) if column in df else default
+        if 'league_tier' in df:
+            X[:, TIER_OFFSET:] = pd.get_dummies(df['league_tier']).reindex(
+                columns=LEAGUE_TIERS, fill_value=0
+            ).to_numpy(dtype=FEATURE_DTYPE)
+        else:
+            X[:, TIER_OFFSET:] = 0.0
+        y = self._targets(df, target_variable)
         
-        X = np.array(features_list)
-        y = np.array(targets)
+        self.feature_names = list(FEATURE_NAMES)
         
-        # Split data
-        if SKLEARN_AVAILABLE and self.scaler is not None:
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
-            )
-            
-            # Scale features
-            X_train_scaled = self.scaler.fit_transform(X_train)
-            X_test_scaled = self.scaler.transform(X_test)
-        else:
-            # Simple split if sklearn not available
-            split_idx = int(len(X) * 0.8)
-            X_train, X_test = X[:split_idx], X[split_idx:]
-            y_train, y_test = y[:split_idx], y[split_idx:]
-            # Simple normalization - store mean/std for later use
-            self._scaler_mean = X_train.mean(axis=0)
-            self._scaler_std = X_train.std(axis=0) + 1e-8
-            X_train_scaled = (X_train - self._scaler_mean) / self._scaler_std
-            X_test_scaled = (X_test - self._scaler_mean) / self._scaler_std
+        # Split data with one shuffled index permutation (no scaling - tree models don't need it)
+        idx = np.random.default_rng(42).permutation(n)
+        split_idx = int(n * 0.8)
+        train_idx, test_idx = idx[:split_idx], idx[split_idx:]
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y[train_idx], y[test_idx]
+        
+        # Drop any legacy scaler loaded earlier; the new model uses raw features
+        self.scaler = None
+        self._scaler_mean = None
+        self._scaler_std = None
         
         # Train model
         if XGBOOST_AVAILABLE:
+            import xgboost as xgb
             print("Training XGBoost model...")
-            self.model = xgb.XGBClassifier(
-                n_estimators=100,
-                max_depth=5,
-                learning_rate=0.1,
-                subsample=0.8,
-                random_state=42,
-                eval_metric='logloss'
+            # Native API: one DMatrix per split, no sklearn wrapper validation/encoding
+            dtrain = xgb.DMatrix(_as_c32(X_train), label=y_train)
+            evals = [(xgb.DMatrix(_as_c32(X_test), label=y_test), 'test')] if len(X_test) > 0 else []
+            self.model = xgb.train(
+                {
+                    'objective': 'binary:logistic',
+                    'eval_metric': 'logloss',
+                    'tree_method': 'hist',
+                    'max_depth': 5,
+                    'eta': 0.1,
+                    'subsample': 0.8,
+                    'max_bin': 128,
+                    'nthread': min(8, os.cpu_count() or 1),
+                    'seed': 42,
+                },
+                dtrain,
+                num_boost_round=100,
+                evals=evals,
+                early_stopping_rounds=10 if evals else None,
+                verbose_eval=False
             )
-            self.model.fit(
-                X_train_scaled, y_train,
-                eval_set=[(X_test_scaled, y_test)] if len(X_test_scaled) > 0 else None,
-                verbose=False
+            self.best_iteration = self.model.best_iteration if evals else None
+        elif LGB_AVAILABLE:
+            import lightgbm as lgb
+            self.best_iteration = None
+            print("XGBoost not available, using LightGBM...")
+            # Native API (the LGBMClassifier wrapper would require scikit-learn);
+            # cross_entropy accepts [0, 1] labels like binary:logistic above
+            self.model = lgb.train(
+                {
+                    'objective': 'cross_entropy',
+                    'max_depth': 5,
+                    'learning_rate': 0.1,
+                    'num_leaves': 31,
+                    'num_threads': min(8, os.cpu_count() or 1),
+                    'seed': 42,
+                    'verbose': -1,
+                },
+                lgb.Dataset(X_train, label=y_train),
+                num_boost_round=100
             )
         elif SKLEARN_AVAILABLE:
-            print("XGBoost not available, using RandomForest...")
+            from sklearn.ensemble import RandomForestClassifier
+            self.best_iteration = None
+            print("XGBoost and LightGBM not available, using RandomForest...")
             self.model = RandomForestClassifier(
                 n_estimators=100,
                 max_depth=10,
                 random_state=42
             )
-            self.model.fit(X_train_scaled, y_train)
+            self.model.fit(X_train, y_train)
         else:
-            raise ImportError("Neither XGBoost nor scikit-learn is available. Please install at least one.")
+            raise ImportError("None of XGBoost, LightGBM or scikit-learn is available. Please install at least one.")
         
         # Evaluate
-        if len(X_test_scaled) > 0:
-            y_pred = self.model.predict(X_test_scaled)
-            y_pred_proba = self.model.predict_proba(X_test_scaled)
-            if y_pred_proba.shape[1] > 1:
-                y_pred_proba = y_pred_proba[:, 1]
-            else:
-                y_pred_proba = y_pred_proba[:, 0]
+        if len(X_test) > 0:
+            y_pred_proba = self._predict_proba(X_test)
+            y_pred = (y_pred_proba > 0.5).astype(y_test.dtype)
             
             if SKLEARN_AVAILABLE:
+                from sklearn.metrics import accuracy_score, precision_score, recall_score
                 accuracy = accuracy_score(y_test, y_pred)
                 precision = precision_score(y_test, y_pred, zero_division=0)
                 recall = recall_score(y_test, y_pred, zero_division=0)
@@ -246,120 +340,190 @@ class FootballPredictor:
         print(f"  Precision: {precision:.3f}")
         print(f"  Recall: {recall:.3f}")
         
-        # Save model
-        joblib.dump(self.model, MODEL_PATH)
-        if self.scaler is not None:
-            joblib.dump(self.scaler, SCALER_PATH)
+        # Save model (boosters in their native formats, others pickled)
+        if _is_booster(self.model):
+            saved_path = XGB_MODEL_PATH
+            self.model.save_model(str(saved_path))
+        elif _is_lgb_booster(self.model):
+            saved_path = LGB_MODEL_PATH
+            self.model.save_model(str(saved_path))
         else:
-            # Save simple scaler stats instead
-            joblib.dump({
-                'mean': self._scaler_mean,
-                'std': self._scaler_std
-            }, SCALER_PATH)
+            saved_path = MODEL_PATH
+            joblib.dump(self.model, saved_path)
+        # Remove other model types' artifacts so load() doesn't pick up a stale one
+        for stale_path in (XGB_MODEL_PATH, LGB_MODEL_PATH, MODEL_PATH):
+            if stale_path != saved_path and stale_path.exists():
+                stale_path.unlink()
+        # Remove a stale scaler from older trainings so it isn't applied to this model
+        if SCALER_PATH.exists():
+            SCALER_PATH.unlink()
         
         with open(FEATURES_PATH, 'w') as f:
             json.dump(self.feature_names, f)
+        with open(MODEL_META_PATH, 'w') as f:
+            json.dump({'best_iteration': self.best_iteration}, f)
         
-        print(f"✅ Model saved to {MODEL_PATH}")
+        print(f"✅ Model saved to {saved_path}")
         
     def predict(self, match_data: Dict, market_type: str = "over_0.5_goals") -> float:
         """Predict probability for a specific market"""
         if self.model is None:
             self.load()
         
-        features = self.extract_features(match_data)
+        self._extract_row(match_data, self._buf[0])
         
-        # Scale features
+        # Get probability
+        return float(self._predict_proba(self._buf)[0])
+    
+    def predict_batch(self, matches: List[Dict], market_type: str = "over_0.5_goals") -> np.ndarray:
+        """Predict probabilities for a slate of matches in a single model call"""
+        if self.model is None:
+            self.load()
+        
+        X = np.empty((len(matches), N_FEATURES), dtype=FEATURE_DTYPE)
+        for i, match_data in enumerate(matches):
+            self._extract_row(match_data, X[i])
+        
+        return self._predict_proba(X)
+    
+    def _predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Positive-class probability for each row of X"""
+        # Legacy models were trained on scaled features; current models use raw features
         if self.scaler is not None:
-            features_scaled = self.scaler.transform(features)
+            X = self.scaler.transform(X).astype(FEATURE_DTYPE)
         elif self._scaler_mean is not None and self._scaler_std is not None:
-            # Use simple normalization
-            features_scaled = (features - self._scaler_mean) / self._scaler_std
-        else:
-            # No scaling available, use raw features
-            features_scaled = features
+            X = ((X - self._scaler_mean) / self._scaler_std).astype(FEATURE_DTYPE)
         
-        # Get probability
-        proba = self.model.predict_proba(features_scaled)[0]
-        probability = proba[1] if len(proba) > 1 else proba[0]
+        if _is_booster(self.model):
+            # Zero-copy path, no DMatrix; binary:logistic already outputs probabilities
+            # (0, 0) = all trees; otherwise stop at the early-stopping best round
+            iteration_range = (0, self.best_iteration + 1) if self.best_iteration is not None else (0, 0)
+            return self.model.inplace_predict(_as_c32(X), iteration_range=iteration_range)
+        if _is_lgb_booster(self.model):
+            return self.model.predict(X)
         
-        return float(probability)
+        # sklearn-style models (RandomForest, or XGBClassifier from older trainings)
+        proba = self.model.predict_proba(X)
+        return proba[:, 1] if proba.shape[1] > 1 else proba[:, 0]
     
     def load(self):
         """Load trained model"""
-        if MODEL_PATH.exists():
+        if XGBOOST_AVAILABLE and XGB_MODEL_PATH.exists():
+            from xgboost import Booster
+            model_path = XGB_MODEL_PATH
+            self.model = Booster()
+            self.model.load_model(str(XGB_MODEL_PATH))
+        elif LGB_AVAILABLE and LGB_MODEL_PATH.exists():
+            from lightgbm import Booster
+            model_path = LGB_MODEL_PATH
+            self.model = Booster(model_file=str(LGB_MODEL_PATH))
+        elif MODEL_PATH.exists():
+            model_path = MODEL_PATH
             self.model = joblib.load(MODEL_PATH)
-            
-            # Try to load scaler (may be StandardScaler or simple dict)
-            if SCALER_PATH.exists():
-                try:
-                    scaler_data = joblib.load(SCALER_PATH)
-                    if isinstance(scaler_data, dict) and 'mean' in scaler_data:
-                        # Simple scaler (no sklearn)
-                        self.scaler = None
-                        self._scaler_mean = scaler_data['mean']
-                        self._scaler_std = scaler_data['std']
-                    else:
-                        # StandardScaler object
-                        self.scaler = scaler_data
-                        self._scaler_mean = None
-                        self._scaler_std = None
-                except Exception as e:
-                    print(f"⚠️ Warning: Could not load scaler: {e}. Using raw features.")
+        else:
+            raise FileNotFoundError(f"Model not found at {MODEL_PATH}. Train the model first.")
+        
+        # Scaler only exists for models trained before scaling was dropped
+        # (may be StandardScaler or simple dict)
+        if SCALER_PATH.exists():
+            try:
+                scaler_data = joblib.load(SCALER_PATH)
+                if isinstance(scaler_data, dict) and 'mean' in scaler_data:
+                    # Simple scaler (no sklearn)
                     self.scaler = None
+                    self._scaler_mean = scaler_data['mean']
+                    self._scaler_std = scaler_data['std']
+                else:
+                    # StandardScaler object
+                    self.scaler = scaler_data
                     self._scaler_mean = None
                     self._scaler_std = None
-            
-            if FEATURES_PATH.exists():
-                with open(FEATURES_PATH, 'r') as f:
-                    self.feature_names = json.load(f)
-            
-            print(f"✅ Model loaded from {MODEL_PATH}")
-        else:
-            raise FileNotFoundError(f"Model not found at {MODEL_PATH}. Train the model first.")
+            except Exception as e:
+                print(f"⚠️ Warning: Could not load scaler: {e}. Using raw features.")
+                self.scaler = None
+                self._scaler_mean = None
+                self._scaler_std = None
+        
+        if FEATURES_PATH.exists():
+            with open(FEATURES_PATH, 'r') as f:
+                self.feature_names = json.load(f)
+        
+        self.best_iteration = None
+        if MODEL_META_PATH.exists():
+            with open(MODEL_META_PATH, 'r') as f:
+                self.best_iteration = json.load(f).get('best_iteration')
+        
+        print(f"✅ Model loaded from {model_path}")
 
 
-def create_sample_training_data() -> List[Dict]:
+def create_sample_training_data(n: int = 100, seed: int = 42) -> List[Dict]:
     """
     Create sample training data for initial model
     In production, load from API-Football or database
+    
+    Args:
+        n: Number of sample matches
+        seed: Seed for the generator; the same (n, seed) always yields the same data
     """
     # This is sample data - replace with real historical data
-    sample_data = []
+    rng = np.random.default_rng(seed)
     
     # Example: Safe match (high-scoring teams, stable league)
-    for i in range(100):
-        sample_data.append({
+    # Draw every field for all samples in one call, then assemble the dicts
+    home_goals_scored = rng.uniform(8, 12, n).tolist()
+    home_goals_conceded = rng.uniform(2, 5, n).tolist()
+    home_form_pct = rng.uniform(0.7, 0.9, n).tolist()
+    home_sot = rng.uniform(5, 7, n).tolist()
+    away_goals_scored = rng.uniform(6, 10, n).tolist()
+    away_goals_conceded = rng.uniform(3, 6, n).tolist()
+    away_form_pct = rng.uniform(0.6, 0.8, n).tolist()
+    away_sot = rng.uniform(4, 6, n).tolist()
+    home_xg = rng.uniform(1.5, 2.0, n).tolist()
+    away_xg = rng.uniform(1.2, 1.8, n).tolist()
+    home_position = rng.integers(3, 12, n).tolist()
+    away_position = rng.integers(5, 15, n).tolist()
+    table_gap = rng.integers(0, 5, n).tolist()
+    pressure_index = rng.uniform(0.2, 0.5, n).tolist()
+    fixture_congestion = rng.integers(3, 7, n).tolist()
+    home_odds = rng.uniform(1.5, 2.5, n).tolist()
+    draw_odds = rng.uniform(3.0, 4.0, n).tolist()
+    away_odds = rng.uniform(2.0, 3.5, n).tolist()
+    league_tier = rng.choice(['EPL', 'LaLiga', 'Bundesliga', 'SerieA'], n).tolist()
+    total_goals = rng.integers(1, 5, n).tolist()  # For "over_0.5_goals" target
+    target = np.where(rng.random(n) > 0.1, 1.0, 0.0).tolist()  # 90% safe
+    
+    return [
+        {
             'home_form': {
-                'goals_scored_5': np.random.uniform(8, 12),
-                'goals_conceded_5': np.random.uniform(2, 5),
-                'form_percentage': np.random.uniform(0.7, 0.9),
-                'shots_on_target_avg': np.random.uniform(5, 7),
+                'goals_scored_5': home_goals_scored[i],
+                'goals_conceded_5': home_goals_conceded[i],
+                'form_percentage': home_form_pct[i],
+                'shots_on_target_avg': home_sot[i],
             },
             'away_form': {
-                'goals_scored_5': np.random.uniform(6, 10),
-                'goals_conceded_5': np.random.uniform(3, 6),
-                'form_percentage': np.random.uniform(0.6, 0.8),
-                'shots_on_target_avg': np.random.uniform(4, 6),
+                'goals_scored_5': away_goals_scored[i],
+                'goals_conceded_5': away_goals_conceded[i],
+                'form_percentage': away_form_pct[i],
+                'shots_on_target_avg': away_sot[i],
             },
-            'home_xg': np.random.uniform(1.5, 2.0),
-            'away_xg': np.random.uniform(1.2, 1.8),
-            'home_position': np.random.randint(3, 12),
-            'away_position': np.random.randint(5, 15),
-            'table_gap': np.random.randint(0, 5),
-            'pressure_index': np.random.uniform(0.2, 0.5),
+            'home_xg': home_xg[i],
+            'away_xg': away_xg[i],
+            'home_position': home_position[i],
+            'away_position': away_position[i],
+            'table_gap': table_gap[i],
+            'pressure_index': pressure_index[i],
             'is_derby': False,
             'is_must_win': False,
-            'fixture_congestion': np.random.randint(3, 7),
-            'home_odds': np.random.uniform(1.5, 2.5),
-            'draw_odds': np.random.uniform(3.0, 4.0),
-            'away_odds': np.random.uniform(2.0, 3.5),
-            'league_tier': np.random.choice(['EPL', 'LaLiga', 'Bundesliga', 'SerieA']),
-            'total_goals': np.random.randint(1, 5),  # For "over_0.5_goals" target
-            'target': 1.0 if np.random.random() > 0.1 else 0.0,  # 90% safe
-        })
-    
-    return sample_data
+            'fixture_congestion': fixture_congestion[i],
+            'home_odds': home_odds[i],
+            'draw_odds': draw_odds[i],
+            'away_odds': away_odds[i],
+            'league_tier': league_tier[i],
+            'total_goals': total_goals[i],
+            'target': target[i],
+        }
+        for i in range(n)
+    ]
 
 
 if __name__ == "__main__":
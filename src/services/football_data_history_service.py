@@ -4,17 +4,193 @@ Fetches historical match data and calculates Form & H2H locally
 Production-ready with caching, rate limiting, and error handling
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+import asyncio
+import importlib.util
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 from collections import defaultdict
 import logging
 from functools import lru_cache
 import os
+import re
+import tempfile
+from email.utils import parsedate_to_datetime
+
+import numpy as np
+
+# RapidFuzz is optional - falls back to plain normalized substring matching
+try:
+    from rapidfuzz import process as rf_process, fuzz as rf_fuzz, utils as rf_utils
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# httpx powers the async variants; without it they run the sync code in a thread
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# pyahocorasick is optional - league names fall back to a precompiled regex
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# diskcache is optional - persists API responses across restarts
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+# Club-type tokens ignored when comparing names, and ASCII punctuation to drop
+_TEAM_TOKEN_RE = re.compile(r"\b(?:fc|sv|sg)\b")
+_ASCII_PUNCTUATION = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c.isspace())
+))
+
+
+@lru_cache(maxsize=2048)
+def normalize_name(name: str) -> str:
+    """Normalize team name: remove "FC", "SV", special chars for comparison"""
+    name = _TEAM_TOKEN_RE.sub("", name.lower()).translate(_ASCII_PUNCTUATION)
+    # Rare non-ASCII punctuation (e.g. typographic apostrophes) needs the slow filter
+    if not name.isascii():
+        name = "".join(c for c in name if c.isalnum() or c.isspace())
+    return " ".join(name.split())  # Normalize spaces
+
+
+@lru_cache(maxsize=8192)
+def _names_match(norm_a: str, norm_b: str) -> bool:
+    """True if either name contains the other (both already normalized)"""
+    return bool(norm_a and norm_b) and (norm_a in norm_b or norm_b in norm_a)
+
+
+# Retry policy shared by the sync (urllib3 Retry) and async request paths
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRY_AFTER = 60.0  # Never wait longer than this, whatever Retry-After says
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or an HTTP-date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class _CappedRetry(Retry):
+    """urllib3 Retry whose Retry-After waits are capped at MAX_RETRY_AFTER"""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER)
+
+
+# One finished match as a fixed-size record (18 bytes): kick-off epoch
+# seconds, team IDs (-1 if unknown) and the full-time score
+MATCH_DTYPE = np.dtype([
+    ("ts", "i8"),
+    ("home_id", "i4"),
+    ("away_id", "i4"),
+    ("home_score", "i1"),
+    ("away_score", "i1"),
+])
+
+
+# Form string bytes indexed by sign(team_score - opponent_score) + 1
+_FORM_CHARS = np.frombuffer(b"LDW", dtype=np.uint8)
+
+
+def _parse_utc_ts(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds for an API utcDate string such as "2024-05-19T15:00:00Z" (None if invalid)"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class _MemoryCache:
+    """In-process stand-in for diskcache.Cache: get/set with per-entry expiry"""
+    
+    def __init__(self):
+        self._data: Dict[str, Tuple[object, Optional[float]]] = {}
+    
+    def get(self, key: str, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+        return value
+    
+    def set(self, key: str, value, expire: Optional[float] = None) -> bool:
+        self._data[key] = (value, time.monotonic() + expire if expire else None)
+        return True
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+    
+    def clear(self) -> int:
+        count = len(self._data)
+        self._data.clear()
+        return count
+
+
+def _open_cache(name: str):
+    """Persistent cache under FOOTBALL_DATA_CACHE_DIR if diskcache is installed"""
+    if DISKCACHE_AVAILABLE:
+        cache_dir = os.getenv("FOOTBALL_DATA_CACHE_DIR", os.path.join(tempfile.gettempdir(), "football_data_cache"))
+        try:
+            return diskcache.Cache(os.path.join(cache_dir, name), size_limit=200 << 20)
+        except Exception as e:
+            logger.warning(f"Could not open disk cache in {cache_dir} ({e}), using in-memory cache")
+    return _MemoryCache()
+
+
+def _compile_league_matcher(name_mapping: Dict[str, str]) -> Tuple["re.Pattern", Dict[str, str]]:
+    """
+    Build one regex alternation over all league names (longest first, so
+    "2. bundesliga" wins over "bundesliga") plus a group-name -> code map
+    """
+    names = sorted(name_mapping, key=len, reverse=True)
+    pattern = re.compile("|".join(f"(?P<l{i}>{re.escape(name)})" for i, name in enumerate(names)))
+    return pattern, {f"l{i}": name_mapping[name] for i, name in enumerate(names)}
+
+
+def _build_league_automaton(name_mapping: Dict[str, str]):
+    """Aho-Corasick automaton over all league names -> (name length, code), or None"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for name, code in name_mapping.items():
+        automaton.add_word(name, (len(name), code))
+    automaton.make_automaton()
+    return automaton
+
+
 class FootballDataHistoryService:
     """
     Professional service for fetching and processing historical match data
@@ -34,6 +210,10 @@ class FootballDataHistoryService:
     RATE_LIMIT_REQUESTS = 10  # Free tier: 10 requests per minute
     RATE_LIMIT_WINDOW = 60  # 60 seconds
     
+    # History windows: one wide fetch is shared by form and H2H
+    HISTORY_WINDOW_DAYS = 365
+    FORM_WINDOW_DAYS = 90
+    
     # League mapping: Our league IDs -> Football-Data.org competition codes
     LEAGUE_MAPPING = {
         39: "PL",      # Premier League (England)
@@ -71,41 +251,119 @@ class FootballDataHistoryService:
         "championship": "ELC",
         "3. liga": "BL3",  # May not exist in Football-Data.org
     }
+    _LEAGUE_RE, _LEAGUE_GROUP_TO_CODE = _compile_league_matcher(LEAGUE_NAME_MAPPING)
+    _LEAGUE_AUTOMATON = _build_league_automaton(LEAGUE_NAME_MAPPING)
+    
+    # Manual mapping for common team name differences
+    # Include German team name variations
+    TEAM_NAME_ALIASES = {
+        "tottenham": "tottenham hotspur",
+        "spurs": "tottenham hotspur",
+        "manchester united": "manchester united fc",
+        "manchester city": "manchester city fc",
+        "arsenal": "arsenal fc",
+        "chelsea": "chelsea fc",
+        "liverpool": "liverpool fc",
+        # German teams (2. Bundesliga, 3. Liga)
+        "preussen munster": "preußen münster",
+        "preussen münster": "preußen münster",
+        "preussen": "preußen münster",
+        "arminia bielefeld": "arminia bielefeld",
+        "dynamo dresden": "sg dynamo dresden",
+        "fortuna dusseldorf": "fortuna düsseldorf",
+        "fortuna düsseldorf": "fortuna düsseldorf",
+        "sv darmstadt": "sv darmstadt 98",
+        "darmstadt 98": "sv darmstadt 98",
+        "elversberg": "sv elversberg",
+        "sv elversberg": "sv elversberg",
+    }
+    
+    # Minimum WRatio score (0-100) for a RapidFuzz match to be accepted
+    FUZZY_SCORE_CUTOFF = 80
     
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
             "X-Auth-Token": self.API_KEY,
-            "Accept": "application/json"
+            "Accept": "application/json",
+            "Connection": "keep-alive"
         })
         
-        # Rate limiting tracking
-        self.request_times: List[float] = []
+        # Pooled keep-alive connections; 429/5xx retried with backoff (honors Retry-After)
+        retry = _CappedRetry(
+            total=RETRY_ATTEMPTS,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=["GET"],
+            raise_on_status=False  # Hand the last response back to _parse_response
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry))
+        
+        # Rate limiting: token bucket refilled continuously at 10 tokens/minute
+        self._tokens = float(self.RATE_LIMIT_REQUESTS)
+        self._last_refill = time.monotonic()
+        self._refill_rate = self.RATE_LIMIT_REQUESTS / self.RATE_LIMIT_WINDOW
         
-        # In-memory cache for API responses (production should use Redis)
-        self._match_cache: Dict[str, List[Dict]] = {}
-        self._team_cache: Dict[str, Dict] = {}
+        # Cache for API responses with TTL - on disk (survives restarts) when
+        # diskcache is installed, otherwise in memory
+        self._match_cache = _open_cache("matches")
+        self._team_cache = _open_cache("teams")
         self._cache_ttl = 3600  # 1 hour cache TTL
+        # Derived per match list, rebuilt lazily in-process
+        # Normalized team name -> team dict, built once per cached match list
+        self._team_index_cache: Dict[str, Dict[str, Dict]] = {}
+        # MATCH_DTYPE records of each history window (see _normalize_matches)
+        self._record_cache: Dict[str, np.ndarray] = {}
+        
+        # Created lazily by the async methods (bound to the running event loop)
+        self._async_client = None
+        self._inflight_requests: Dict[str, asyncio.Future] = {}
         
         logger.info("FootballDataHistoryService initialized")
     
-    def _rate_limit(self):
-        """Enforce rate limiting: 10 requests per minute"""
-        now = time.time()
-        
-        # Remove requests older than 1 minute
-        self.request_times = [t for t in self.request_times if now - t < self.RATE_LIMIT_WINDOW]
+    def _reserve_token(self) -> float:
+        """
+        Take one token from the bucket and return how long to wait before using it
         
-        # If we've hit the limit, wait
-        if len(self.request_times) >= self.RATE_LIMIT_REQUESTS:
-            sleep_time = self.RATE_LIMIT_WINDOW - (now - self.request_times[0]) + 0.5
-            if sleep_time > 0:
-                logger.warning(f"Rate limit reached. Sleeping for {sleep_time:.1f} seconds...")
-                time.sleep(sleep_time)
-                # Clean up again after sleep
-                self.request_times = [t for t in self.request_times if now - t < self.RATE_LIMIT_WINDOW]
+        A token that isn't available yet is reserved ahead of time, so
+        concurrent callers queue up behind each other without a lock.
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.RATE_LIMIT_REQUESTS),
+            self._tokens + (now - self._last_refill) * self._refill_rate
+        )
+        self._last_refill = now
+        self._tokens -= 1
         
-        self.request_times.append(time.time())
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self._refill_rate
+    
+    def _rate_limit(self):
+        """Enforce rate limiting: 10 requests per minute (token bucket)"""
+        sleep_time = self._reserve_token()
+        if sleep_time > 0:
+            logger.warning(f"Rate limit reached. Sleeping for {sleep_time:.1f} seconds...")
+            time.sleep(sleep_time)
+    
+    async def _rate_limit_async(self):
+        """Async-aware variant of _rate_limit (doesn't block the event loop)"""
+        sleep_time = self._reserve_token()
+        if sleep_time > 0:
+            logger.warning(f"Rate limit reached. Sleeping for {sleep_time:.1f} seconds...")
+            await asyncio.sleep(sleep_time)
+    
+    def _parse_response(self, response, url: str) -> Optional[Dict]:
+        """Turn a non-429 response (requests or httpx) into JSON or None"""
+        if response.status_code == 200:
+            return response.json()
+        elif response.status_code == 403:
+            logger.error(f"Forbidden (403): Check API key or rate limits. URL: {url}")
+            return None
+        else:
+            logger.error(f"API error {response.status_code}: {response.text[:200]}")
+            return None
     
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
         """
@@ -117,19 +375,7 @@ class FootballDataHistoryService:
         
         try:
             response = self.session.get(url, params=params, timeout=15)
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 403:
-                logger.error(f"Forbidden (403): Check API key or rate limits. URL: {url}")
-                return None
-            elif response.status_code == 429:
-                logger.warning("Rate limit exceeded. Waiting...")
-                time.sleep(60)  # Wait 1 minute
-                return self._make_request(endpoint, params)  # Retry once
-            else:
-                logger.error(f"API error {response.status_code}: {response.text[:200]}")
-                return None
+            return self._parse_response(response, url)
                 
         except requests.exceptions.Timeout:
             logger.error(f"Request timeout for {url}")
@@ -138,6 +384,58 @@ class FootballDataHistoryService:
             logger.error(f"Request error: {e}")
             return None
     
+    def _get_async_client(self):
+        """Create the shared httpx.AsyncClient on first use"""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                headers=dict(self.session.headers),
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                timeout=15.0
+            )
+        return self._async_client
+    
+    async def _make_request_async(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Async variant of _make_request on a pooled httpx.AsyncClient
+        """
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self._make_request, endpoint, params)
+        
+        await self._rate_limit_async()
+        
+        url = f"{self.BASE_URL}{endpoint}"
+        
+        try:
+            # Same policy as the sync adapter: bounded retries, Retry-After honored (capped)
+            for attempt in range(RETRY_ATTEMPTS + 1):
+                response = await self._get_async_client().get(endpoint, params=params)
+                if response.status_code not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS:
+                    break
+                
+                delay = _retry_after_seconds(response.headers.get("Retry-After"))
+                if delay is None:
+                    delay = RETRY_BACKOFF_FACTOR * (2 ** attempt)
+                delay = min(delay, MAX_RETRY_AFTER)
+                logger.warning(f"API returned {response.status_code}, retrying in {delay:.1f}s ({attempt + 1}/{RETRY_ATTEMPTS})")
+                await asyncio.sleep(delay)
+            
+            return self._parse_response(response, url)
+        
+        except httpx.TimeoutException:
+            logger.error(f"Request timeout for {url}")
+            return None
+        except httpx.HTTPError as e:
+            logger.error(f"Request error: {e}")
+            return None
+    
+    async def aclose(self):
+        """Close the async HTTP client (call before the event loop shuts down)"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
     def get_competition_code(self, league_id: Optional[int] = None, league_name: Optional[str] = None) -> Optional[str]:
         """
         Map league ID or name to Football-Data.org competition code
@@ -147,12 +445,33 @@ class FootballDataHistoryService:
         
         if league_name:
             league_lower = league_name.lower()
-            for name, code in self.LEAGUE_NAME_MAPPING.items():
-                if name in league_lower:
-                    return code
+            
+            # Single pass over the text for all names; the longest hit wins
+            if self._LEAGUE_AUTOMATON is not None:
+                best = max((value for _, value in self._LEAGUE_AUTOMATON.iter(league_lower)), default=None)
+                return best[1] if best else None
+            
+            match = self._LEAGUE_RE.search(league_lower)
+            if match:
+                return self._LEAGUE_GROUP_TO_CODE[match.lastgroup]
         
         return None
     
+    @staticmethod
+    def _matches_cache_key(competition_code: str, date_from: Optional[str], date_to: Optional[str]) -> str:
+        """Cache key shared by the match list and its team index"""
+        return f"{competition_code}_{date_from}_{date_to}"
+    
+    @staticmethod
+    def _build_team_index(teams: Iterable[Dict]) -> Dict[str, Dict]:
+        """Map normalized team name -> team dict (first team wins on collisions)"""
+        index: Dict[str, Dict] = {}
+        for team in teams:
+            name = team.get("name")
+            if name:
+                index.setdefault(normalize_name(name), team)
+        return index
+    
     def fetch_finished_matches(
         self,
         competition_code: str,
@@ -172,125 +491,283 @@ class FootballDataHistoryService:
         Returns:
             List of match dictionaries with scores and team info
         """
-        cache_key = f"{competition_code}_{date_from}_{date_to}"
+        cache_key = self._matches_cache_key(competition_code, date_from, date_to)
         
         # Check cache
-        if cache_key in self._match_cache:
+        cached = self._match_cache.get(cache_key)
+        if cached is not None:
             logger.debug(f"Cache hit for {cache_key}")
-            return self._match_cache[cache_key]
+            return cached
         
+        endpoint = f"/competitions/{competition_code}/matches"
+        data = self._make_request(endpoint, self._matches_params(date_from, date_to))
+        return self._store_matches(competition_code, cache_key, data, limit)
+    
+    async def fetch_finished_matches_async(
+        self,
+        competition_code: str,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = 100
+    ) -> List[Dict]:
+        """Async variant of fetch_finished_matches (shares the same cache)"""
+        cache_key = self._matches_cache_key(competition_code, date_from, date_to)
+        
+        cached = self._match_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Cache hit for {cache_key}")
+            return cached
+        
+        # Concurrent callers asking for the same list share one request
+        request = self._inflight_requests.get(cache_key)
+        if request is None:
+            endpoint = f"/competitions/{competition_code}/matches"
+            request = asyncio.ensure_future(
+                self._make_request_async(endpoint, self._matches_params(date_from, date_to))
+            )
+            self._inflight_requests[cache_key] = request
+            request.add_done_callback(lambda _: self._inflight_requests.pop(cache_key, None))
+        data = await request
+        
+        cached = self._match_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        return self._store_matches(competition_code, cache_key, data, limit)
+    
+    @staticmethod
+    def _matches_params(date_from: Optional[str], date_to: Optional[str]) -> Dict:
+        """Query parameters for a finished-matches request"""
         params = {"status": "FINISHED"}
         if date_from:
             params["dateFrom"] = date_from
         if date_to:
             params["dateTo"] = date_to
-        
-        endpoint = f"/competitions/{competition_code}/matches"
-        data = self._make_request(endpoint, params)
-        
+        return params
+    
+    def _store_matches(self, competition_code: str, cache_key: str, data: Optional[Dict], limit: int) -> List[Dict]:
+        """Extract, trim and cache the matches from an API response"""
         if not data:
             logger.warning(f"Failed to fetch matches for {competition_code}")
             return []
         
-        matches = data.get("matches", [])
-        
+        return self._cache_matches(competition_code, cache_key, data.get("matches", []), limit)
+    
+    def _cache_matches(self, competition_code: str, cache_key: str, matches: List[Dict], limit: int) -> List[Dict]:
+        """Trim, annotate and cache one competition's match list"""
         # Limit results
         if limit and len(matches) > limit:
             matches = matches[:limit]
         
+        # Parse kick-off times once; cached matches carry the epoch seconds in "_ts"
+        for match in matches:
+            match["_ts"] = _parse_utc_ts(match.get("utcDate"))
+        
         # Cache results
-        self._match_cache[cache_key] = matches
+        self._match_cache.set(cache_key, matches, expire=self._cache_ttl)
+        # Fresh data: derived views are rebuilt on next use
+        self._team_index_cache.pop(cache_key, None)
+        self._record_cache.pop(cache_key, None)
         
         logger.info(f"Fetched {len(matches)} finished matches for {competition_code}")
         return matches
     
-    def _match_team_name(self, team_name: str, team_list: List[Dict]) -> Optional[Dict]:
+    def fetch_finished_matches_multi(
+        self,
+        competition_codes: List[str],
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch finished matches for several competitions with one request
+        
+        Uses /matches?competitions=PL,BL1,... and caches each competition's
+        list under the same key fetch_finished_matches uses, so later form
+        and H2H calculations for these competitions are served from cache.
+        Competitions missing from the response (or a failed request) are
+        left uncached and fall back to their own request when needed.
+        
+        Returns:
+            {competition_code: [match, ...]} for every requested code
+        """
+        results: Dict[str, List[Dict]] = {}
+        missing = []
+        for code in dict.fromkeys(competition_codes):
+            cached = self._match_cache.get(self._matches_cache_key(code, date_from, date_to))
+            if cached is not None:
+                results[code] = cached
+            else:
+                missing.append(code)
+        
+        if missing:
+            params = self._matches_params(date_from, date_to)
+            params["competitions"] = ",".join(missing)
+            data = self._make_request("/matches", params)
+            
+            grouped: Dict[str, List[Dict]] = defaultdict(list)
+            for match in (data or {}).get("matches", []):
+                grouped[(match.get("competition") or {}).get("code")].append(match)
+            
+            for code in missing:
+                if code in grouped:
+                    cache_key = self._matches_cache_key(code, date_from, date_to)
+                    results[code] = self._cache_matches(code, cache_key, grouped[code], limit=0)
+                else:
+                    results[code] = []
+        
+        return results
+    
+    def prefetch_history_windows(self, competition_codes: List[str], until: Optional[datetime] = None) -> Dict[str, List[Dict]]:
+        """
+        Warm the shared history window of several competitions in one request
+        
+        Call before a batch of calculate_team_form / calculate_h2h calls
+        (e.g. a daily coupon spanning several leagues).
+        """
+        date_from, date_to = self._window_range(until, None)
+        return self.fetch_finished_matches_multi(competition_codes, date_from=date_from, date_to=date_to)
+    
+    def fetch_finished_matches_window(
+        self,
+        competition_code: str,
+        until: Optional[datetime] = None,
+        days: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Fetch all finished matches in the widest history window ending at `until`
+        
+        Form and H2H both read from this list, so a prediction costs one
+        API request per competition and day instead of one per calculation.
+        """
+        date_from, date_to = self._window_range(until, days)
+        
+        # No limit: the window is filtered locally by each calculation
+        return self.fetch_finished_matches(competition_code, date_from=date_from, date_to=date_to, limit=0)
+    
+    async def fetch_finished_matches_window_async(
+        self,
+        competition_code: str,
+        until: Optional[datetime] = None,
+        days: Optional[int] = None
+    ) -> List[Dict]:
+        """Async variant of fetch_finished_matches_window"""
+        date_from, date_to = self._window_range(until, days)
+        return await self.fetch_finished_matches_async(competition_code, date_from=date_from, date_to=date_to, limit=0)
+    
+    def _window_range(self, until: Optional[datetime], days: Optional[int]) -> Tuple[str, str]:
+        """(date_from, date_to) strings for a history window ending at `until`"""
+        until_date = (until or datetime.utcnow()).date()
+        date_from = (until_date - timedelta(days=days or self.HISTORY_WINDOW_DAYS)).strftime("%Y-%m-%d")
+        return date_from, until_date.strftime("%Y-%m-%d")
+    
+    def _match_team_name(
+        self,
+        team_name: str,
+        team_list: List[Dict],
+        index: Optional[Dict[str, Dict]] = None
+    ) -> Optional[Dict]:
         """
         Match team name using fuzzy matching and manual rules
+        
+        Pass every candidate team at once: names are normalized a single
+        time per call and the fuzzy step scores all of them together.
+        `index` is an optional prebuilt {normalize_name(name): team} map
+        for team_list (see _build_team_index).
         """
+        # Fast path: most names are identical once normalized - one hash probe
+        if index is None:
+            index = self._build_team_index(team_list)
+        team = index.get(normalize_name(team_name))
+        if team is not None:
+            return team
+        
         team_name_lower = team_name.lower().strip()
+        api_names = [team.get("name", "").lower() for team in team_list]
         
         # Try exact match first
-        for team in team_list:
-            if team_name_lower == team.get("name", "").lower():
+        for team, team_api_name in zip(team_list, api_names):
+            if team_name_lower == team_api_name:
                 return team
         
         # Try partial match (team name contains or is contained)
-        for team in team_list:
-            team_api_name = team.get("name", "").lower()
-            if team_name_lower in team_api_name or team_api_name in team_name_lower:
-                return team
-        
-        # Try fuzzy matching (remove special characters, extra words)
-        # Normalize team names: remove "FC", "SV", numbers, special chars for comparison
-        def normalize_name(name: str) -> str:
-            # Remove common prefixes/suffixes
-            name = name.lower().replace("fc", "").replace("sv", "").replace("sg", "")
-            # Remove extra whitespace and special chars except spaces
-            name = "".join(c if c.isalnum() or c.isspace() else "" for c in name)
-            return " ".join(name.split())  # Normalize spaces
-        
-        normalized_search = normalize_name(team_name_lower)
-        for team in team_list:
-            team_api_normalized = normalize_name(team.get("name", ""))
-            if normalized_search in team_api_normalized or team_api_normalized in normalized_search:
-                logger.info(f"Matched '{team_name}' to '{team.get('name')}' using normalized matching")
+        for team, team_api_name in zip(team_list, api_names):
+            if _names_match(team_name_lower, team_api_name):
                 return team
         
         # Manual mapping for common differences
-        # Include German team name variations
-        manual_mappings = {
-            "tottenham": "tottenham hotspur",
-            "spurs": "tottenham hotspur",
-            "manchester united": "manchester united fc",
-            "manchester city": "manchester city fc",
-            "arsenal": "arsenal fc",
-            "chelsea": "chelsea fc",
-            "liverpool": "liverpool fc",
-            # German teams (2. Bundesliga, 3. Liga)
-            "preussen munster": "preußen münster",
-            "preussen münster": "preußen münster",
-            "preussen": "preußen münster",
-            "arminia bielefeld": "arminia bielefeld",
-            "dynamo dresden": "sg dynamo dresden",
-            "fortuna dusseldorf": "fortuna düsseldorf",
-            "fortuna düsseldorf": "fortuna düsseldorf",
-            "sv darmstadt": "sv darmstadt 98",
-            "darmstadt 98": "sv darmstadt 98",
-            "elversberg": "sv elversberg",
-            "sv elversberg": "sv elversberg",
-        }
-        
-        for key, value in manual_mappings.items():
+        for key, value in self.TEAM_NAME_ALIASES.items():
             if key in team_name_lower:
-                for team in team_list:
-                    if value in team.get("name", "").lower():
+                for team, team_api_name in zip(team_list, api_names):
+                    if value in team_api_name:
                         return team
         
+        # Try fuzzy matching against all candidates in one go
+        if RAPIDFUZZ_AVAILABLE:
+            choices = {i: rf_utils.default_process(name) for i, name in enumerate(api_names)}
+            best = rf_process.extractOne(
+                rf_utils.default_process(team_name_lower),
+                choices,
+                scorer=rf_fuzz.WRatio,
+                processor=None,
+                score_cutoff=self.FUZZY_SCORE_CUTOFF
+            )
+            if best:
+                team = team_list[best[2]]
+                logger.info(f"Matched '{team_name}' to '{team.get('name')}' using fuzzy matching (score {best[1]:.0f})")
+                return team
+        else:
+            normalized_search = normalize_name(team_name_lower)
+            for team, team_api_name in zip(team_list, api_names):
+                if _names_match(normalized_search, normalize_name(team_api_name)):
+                    logger.info(f"Matched '{team_name}' to '{team.get('name')}' using normalized matching")
+                    return team
+        
         logger.warning(f"Could not match team name: {team_name}")
         return None
     
+    def _team_index(self, matches_cache_key: str) -> Dict[str, Dict]:
+        """Team index for a cached match list (empty if the list isn't cached)"""
+        index = self._team_index_cache.get(matches_cache_key)
+        if index is None:
+            matches = self._match_cache.get(matches_cache_key)
+            if matches is None:
+                return {}
+            index = self._build_team_index(
+                match.get(side) or {} for match in matches for side in ("homeTeam", "awayTeam")
+            )
+            self._team_index_cache[matches_cache_key] = index
+        return index
+    
     def get_team_id_from_matches(self, team_name: str, competition_code: str) -> Optional[int]:
         """
         Get team ID by fetching matches and matching team name
         """
         cache_key = f"team_id_{team_name}_{competition_code}"
-        if cache_key in self._team_cache:
-            return self._team_cache[cache_key].get("id")
+        cached = self._team_cache.get(cache_key)
+        if cached is not None:
+            return cached.get("id")
         
         # Fetch recent matches to find team
-        matches = self.fetch_finished_matches(competition_code, limit=50)
+        self.fetch_finished_matches(competition_code, limit=50)
+        return self._lookup_team_id(team_name, competition_code, cache_key)
+    
+    async def get_team_id_from_matches_async(self, team_name: str, competition_code: str) -> Optional[int]:
+        """Async variant of get_team_id_from_matches"""
+        cache_key = f"team_id_{team_name}_{competition_code}"
+        cached = self._team_cache.get(cache_key)
+        if cached is not None:
+            return cached.get("id")
         
-        for match in matches:
-            home_team = match.get("homeTeam", {})
-            away_team = match.get("awayTeam", {})
-            
-            if self._match_team_name(team_name, [home_team]):
-                self._team_cache[cache_key] = home_team
-                return home_team.get("id")
-            if self._match_team_name(team_name, [away_team]):
-                self._team_cache[cache_key] = away_team
-                return away_team.get("id")
+        await self.fetch_finished_matches_async(competition_code, limit=50)
+        return self._lookup_team_id(team_name, competition_code, cache_key)
+    
+    def _lookup_team_id(self, team_name: str, competition_code: str, cache_key: str) -> Optional[int]:
+        """Resolve a team name against the cached team index for a competition"""
+        index = self._team_index(self._matches_cache_key(competition_code, None, None))
+        
+        team = self._match_team_name(team_name, list(index.values()), index=index) if index else None
+        if team:
+            self._team_cache.set(cache_key, team, expire=self._cache_ttl)
+            return team.get("id")
         
         return None
     
@@ -317,26 +794,95 @@ class FootballDataHistoryService:
                 'clean_sheets': int
             }
         """
-        # Fetch matches up to before_date
-        date_to = before_date.strftime("%Y-%m-%d")
-        date_from = (before_date - timedelta(days=90)).strftime("%Y-%m-%d")
+        # Fetch matches up to before_date (shared with calculate_h2h)
+        all_matches = self.fetch_finished_matches_window(competition_code, until=before_date)
         
-        all_matches = self.fetch_finished_matches(
-            competition_code,
-            date_from=date_from,
-            date_to=date_to,
-            limit=200  # Fetch more to ensure we have enough team matches
+        # Get team ID first - if this fails, we can't find form
+        team_id = self.get_team_id_from_matches(team_name, competition_code)
+        records = self._window_records(competition_code, before_date, all_matches)
+        return self._team_form_from_matches(team_name, competition_code, team_id, records, before_date, matches_needed)
+    
+    async def calculate_team_form_async(
+        self,
+        team_name: str,
+        competition_code: str,
+        before_date: datetime,
+        matches_needed: int = 5
+    ) -> Dict:
+        """
+        Async variant of calculate_team_form
+        
+        The match window and the team ID are fetched concurrently; gather
+        several of these (and calculate_h2h_async) to overlap their requests.
+        """
+        all_matches, team_id = await asyncio.gather(
+            self.fetch_finished_matches_window_async(competition_code, until=before_date),
+            self.get_team_id_from_matches_async(team_name, competition_code)
         )
+        records = self._window_records(competition_code, before_date, all_matches)
+        return self._team_form_from_matches(team_name, competition_code, team_id, records, before_date, matches_needed)
+    
+    @staticmethod
+    def _normalize_matches(matches: List[Dict]) -> np.ndarray:
+        """
+        Pack API matches into a MATCH_DTYPE structured array (kick-off from
+        the "_ts" parsed at fetch time). Matches without a final score or
+        kick-off time are dropped; a missing team ID becomes -1.
         
-        # Filter matches for this team and sort by date (newest first)
-        team_matches = []
+        Rows are sorted newest first, so the last N matches of any filtered
+        selection are simply its first N rows.
+        """
+        records = np.empty(len(matches), dtype=MATCH_DTYPE)
+        n = 0
+        for match in matches:
+            score = (match.get("score") or {}).get("fullTime") or {}
+            home_score, away_score = score.get("home"), score.get("away")
+            ts = match["_ts"] if "_ts" in match else _parse_utc_ts(match.get("utcDate"))
+            if home_score is None or away_score is None or ts is None:
+                continue
+            records[n] = (
+                int(ts),
+                (match.get("homeTeam") or {}).get("id") or -1,
+                (match.get("awayTeam") or {}).get("id") or -1,
+                home_score,
+                away_score,
+            )
+            n += 1
         
-        # Get team ID first - if this fails, we can't find form
-        team_id = self.get_team_id_from_matches(team_name, competition_code)
+        records = records[:n]
+        return records[np.argsort(-records["ts"], kind="stable")]
+    
+    def _window_records(self, competition_code: str, until: datetime, matches: List[Dict]) -> np.ndarray:
+        """Match records for a history window, built once per cached window"""
+        cache_key = self._matches_cache_key(competition_code, *self._window_range(until, None))
+        records = self._record_cache.get(cache_key)
+        if records is None:
+            records = self._normalize_matches(matches)
+            if cache_key in self._match_cache:  # Don't cache failed fetches
+                self._record_cache[cache_key] = records
+        return records
+    
+    @staticmethod
+    def _epoch_seconds(value: datetime) -> float:
+        """Epoch seconds comparable with MATCH_DTYPE "ts" (naive datetimes are taken as UTC)"""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    
+    def _team_form_from_matches(
+        self,
+        team_name: str,
+        competition_code: str,
+        team_id: Optional[int],
+        matches: np.ndarray,
+        before_date: datetime,
+        matches_needed: int
+    ) -> Dict:
+        """Calculate form for a resolved team from an already fetched match window"""
         if not team_id:
             logger.warning(f"⚠️ Could not find team ID for '{team_name}' in {competition_code}")
             logger.warning(f"   This means team name matching failed - team might not be in Football-Data.org database")
-            logger.warning(f"   Searched {len(all_matches)} matches from {competition_code}")
+            logger.warning(f"   Searched {len(matches)} matches from {competition_code}")
             return {
                 'goals_scored_5': 0,
                 'goals_conceded_5': 0,
@@ -353,70 +899,42 @@ class FootballDataHistoryService:
                 'source': 'team_not_found'
             }
         
-        for match in all_matches:
-            match_date_str = match.get("utcDate", "")
-            if not match_date_str:
-                continue
-            
-            try:
-                match_date = datetime.fromisoformat(match_date_str.replace("Z", "+00:00"))
-                if match_date >= before_date:
-                    continue  # Skip future matches
-            except:
-                continue
-            
-            home_team = match.get("homeTeam", {})
-            away_team = match.get("awayTeam", {})
-            
-            # Check if team is in this match
-            is_home = self._match_team_name(team_name, [home_team])
-            is_away = self._match_team_name(team_name, [away_team])
-            
-            if is_home or is_away:
-                score = match.get("score", {}).get("fullTime", {})
-                home_score = score.get("home")
-                away_score = score.get("away")
-                
-                if home_score is None or away_score is None:
-                    continue  # Skip matches without scores
-                
-                team_matches.append({
-                    "date": match_date,
-                    "is_home": is_home,
-                    "home_score": home_score,
-                    "away_score": away_score,
-                    "team_score": home_score if is_home else away_score,
-                    "opponent_score": away_score if is_home else home_score,
-                })
-        
-        # Sort by date (newest first) and take last N
-        team_matches.sort(key=lambda x: x["date"], reverse=True)
-        team_matches = team_matches[:matches_needed]
-        
-        if len(team_matches) < 3:  # Need at least 3 matches for meaningful form
-            logger.warning(f"Insufficient matches for {team_name} (found {len(team_matches)})")
+        # Matches for this team in the form window before the fixture, newest first
+        before = self._epoch_seconds(before_date)
+        form_start = before - self.FORM_WINDOW_DAYS * 86400
+        dates = matches["ts"]
+        mask = (
+            ((matches["home_id"] == team_id) | (matches["away_id"] == team_id))
+            & (dates < before)
+            & (dates >= form_start)
+        )
+        team_matches = matches[mask][:matches_needed]
+        n = len(team_matches)
+        
+        if n < 3:  # Need at least 3 matches for meaningful form
+            logger.warning(f"Insufficient matches for {team_name} (found {n})")
             return self._default_form()  # Return safe defaults
         
         # Calculate statistics
-        goals_scored = sum(m["team_score"] for m in team_matches)
-        goals_conceded = sum(m["opponent_score"] for m in team_matches)
-        wins = sum(1 for m in team_matches if m["team_score"] > m["opponent_score"])
-        draws = sum(1 for m in team_matches if m["team_score"] == m["opponent_score"])
-        losses = sum(1 for m in team_matches if m["team_score"] < m["opponent_score"])
-        clean_sheets = sum(1 for m in team_matches if m["opponent_score"] == 0)
+        is_home = team_matches["home_id"] == team_id
+        home_scores = team_matches["home_score"]
+        away_scores = team_matches["away_score"]
+        team_score = np.where(is_home, home_scores, away_scores)
+        opponent_score = np.where(is_home, away_scores, home_scores)
+        
+        goals_scored = int(team_score.sum())
+        goals_conceded = int(opponent_score.sum())
+        wins = int((team_score > opponent_score).sum())
+        draws = int((team_score == opponent_score).sum())
+        losses = n - wins - draws
+        clean_sheets = int((opponent_score == 0).sum())
+        
+        # Build form string (W=Win, D=Draw, L=Loss): one ASCII byte per match, decoded once
+        result = np.sign(team_score.astype(np.int16) - opponent_score) + 1
+        form_string = _FORM_CHARS[result].tobytes().decode("ascii")
         
         points = wins * 3 + draws
-        form_percentage = wins / len(team_matches) if team_matches else 0.0
-        
-        # Build form string (W=Win, D=Draw, L=Loss)
-        form_string = ""
-        for m in team_matches:
-            if m["team_score"] > m["opponent_score"]:
-                form_string += "W"
-            elif m["team_score"] == m["opponent_score"]:
-                form_string += "D"
-            else:
-                form_string += "L"
+        form_percentage = wins / n
         
         return {
             "goals_scored_5": goals_scored,
@@ -428,9 +946,9 @@ class FootballDataHistoryService:
             "form_string": form_string,
             "points_5": points,
             "clean_sheets": clean_sheets,
-            "matches_count": len(team_matches),
-            "avg_goals_scored": goals_scored / len(team_matches) if team_matches else 0.0,
-            "avg_goals_conceded": goals_conceded / len(team_matches) if team_matches else 0.0,
+            "matches_count": n,
+            "avg_goals_scored": goals_scored / n,
+            "avg_goals_conceded": goals_conceded / n,
         }
     
     def calculate_h2h(
@@ -455,79 +973,80 @@ class FootballDataHistoryService:
                 'recent_trend': str,  # "team1_favored", "team2_favored", "balanced"
             }
         """
-        date_to = before_date.strftime("%Y-%m-%d")
-        date_from = (before_date - timedelta(days=365)).strftime("%Y-%m-%d")  # Last year
-        
-        all_matches = self.fetch_finished_matches(
-            competition_code,
-            date_from=date_from,
-            date_to=date_to,
-            limit=500  # Fetch more to find H2H matches
-        )
-        
-        # Find matches between these two teams
-        h2h_matches = []
+        # Resolve both teams first (small, usually cached request) - if either
+        # is unknown no H2H pair can exist, so skip the history fetch entirely
         team1_id = self.get_team_id_from_matches(team1_name, competition_code)
         team2_id = self.get_team_id_from_matches(team2_name, competition_code)
+        if team1_id is None or team2_id is None:
+            logger.warning(f"No H2H history found between {team1_name} and {team2_name} (team not found in {competition_code})")
+            return self._default_h2h()
         
-        for match in all_matches:
-            match_date_str = match.get("utcDate", "")
-            if not match_date_str:
-                continue
-            
-            try:
-                match_date = datetime.fromisoformat(match_date_str.replace("Z", "+00:00"))
-                if match_date >= before_date:
-                    continue
-            except:
-                continue
-            
-            home_team = match.get("homeTeam", {})
-            away_team = match.get("awayTeam", {})
-            
-            # Check if both teams are in this match
-            home_is_team1 = self._match_team_name(team1_name, [home_team])
-            away_is_team1 = self._match_team_name(team1_name, [away_team])
-            home_is_team2 = self._match_team_name(team2_name, [home_team])
-            away_is_team2 = self._match_team_name(team2_name, [away_team])
-            
-            if (home_is_team1 and away_is_team2) or (home_is_team2 and away_is_team1):
-                score = match.get("score", {}).get("fullTime", {})
-                home_score = score.get("home")
-                away_score = score.get("away")
-                
-                if home_score is None or away_score is None:
-                    continue
-                
-                # Determine which team is team1
-                team1_is_home = home_is_team1
-                team1_score = home_score if team1_is_home else away_score
-                team2_score = away_score if team1_is_home else home_score
-                
-                h2h_matches.append({
-                    "date": match_date,
-                    "team1_score": team1_score,
-                    "team2_score": team2_score,
-                })
+        # Last year of matches (shared with calculate_team_form)
+        all_matches = self.fetch_finished_matches_window(competition_code, until=before_date)
+        records = self._window_records(competition_code, before_date, all_matches)
+        return self._h2h_from_matches(team1_name, team2_name, team1_id, team2_id, records, before_date, matches_needed)
+    
+    async def calculate_h2h_async(
+        self,
+        team1_name: str,
+        team2_name: str,
+        competition_code: str,
+        before_date: datetime,
+        matches_needed: int = 5
+    ) -> Dict:
+        """Async variant of calculate_h2h (both team IDs resolved concurrently)"""
+        team1_id, team2_id = await asyncio.gather(
+            self.get_team_id_from_matches_async(team1_name, competition_code),
+            self.get_team_id_from_matches_async(team2_name, competition_code)
+        )
+        if team1_id is None or team2_id is None:
+            logger.warning(f"No H2H history found between {team1_name} and {team2_name} (team not found in {competition_code})")
+            return self._default_h2h()
         
-        # Sort by date (newest first) and take last N
-        h2h_matches.sort(key=lambda x: x["date"], reverse=True)
-        h2h_matches = h2h_matches[:matches_needed]
+        all_matches = await self.fetch_finished_matches_window_async(competition_code, until=before_date)
+        records = self._window_records(competition_code, before_date, all_matches)
+        return self._h2h_from_matches(team1_name, team2_name, team1_id, team2_id, records, before_date, matches_needed)
+    
+    def _h2h_from_matches(
+        self,
+        team1_name: str,
+        team2_name: str,
+        team1_id: int,
+        team2_id: int,
+        matches: np.ndarray,
+        before_date: datetime,
+        matches_needed: int
+    ) -> Dict:
+        """Calculate H2H for two resolved teams from an already fetched match window"""
+        # Find matches between these two teams, newest first
+        home_ids = matches["home_id"]
+        away_ids = matches["away_id"]
+        mask = (
+            (((home_ids == team1_id) & (away_ids == team2_id)) | ((home_ids == team2_id) & (away_ids == team1_id)))
+            & (matches["ts"] < self._epoch_seconds(before_date))
+        )
+        h2h_matches = matches[mask][:matches_needed]
         
         if len(h2h_matches) == 0:
             logger.warning(f"No H2H history found between {team1_name} and {team2_name}")
             return self._default_h2h()
         
         # Calculate statistics
-        team1_wins = sum(1 for m in h2h_matches if m["team1_score"] > m["team2_score"])
-        team2_wins = sum(1 for m in h2h_matches if m["team2_score"] > m["team1_score"])
-        draws = sum(1 for m in h2h_matches if m["team1_score"] == m["team2_score"])
+        team1_is_home = h2h_matches["home_id"] == team1_id
+        home_scores = h2h_matches["home_score"]
+        away_scores = h2h_matches["away_score"]
+        team1_scores = np.where(team1_is_home, home_scores, away_scores)
+        team2_scores = np.where(team1_is_home, away_scores, home_scores)
         
-        team1_goals = sum(m["team1_score"] for m in h2h_matches)
-        team2_goals = sum(m["team2_score"] for m in h2h_matches)
+        team1_wins = int((team1_scores > team2_scores).sum())
+        team2_wins = int((team2_scores > team1_scores).sum())
+        draws = int((team1_scores == team2_scores).sum())
+        team1_goals = int(team1_scores.sum())
+        team2_goals = int(team2_scores.sum())
         
-        avg_goals_team1 = team1_goals / len(h2h_matches) if h2h_matches else 0.0
-        avg_goals_team2 = team2_goals / len(h2h_matches) if h2h_matches else 0.0
+        n = len(h2h_matches)
+        avg_goals_team1 = team1_goals / n
+        avg_goals_team2 = team2_goals / n
         
         # Determine recent trend
         if team1_wins > team2_wins + 1:
@@ -541,12 +1060,12 @@ class FootballDataHistoryService:
             "team1_wins": team1_wins,
             "team2_wins": team2_wins,
             "draws": draws,
-            "total_matches": len(h2h_matches),
+            "total_matches": n,
             "avg_goals_team1": avg_goals_team1,
             "avg_goals_team2": avg_goals_team2,
             "recent_trend": recent_trend,
             "total_goals": team1_goals + team2_goals,
-            "avg_total_goals": (team1_goals + team2_goals) / len(h2h_matches) if h2h_matches else 0.0,
+            "avg_total_goals": (team1_goals + team2_goals) / n,
         }
     
     def _default_form(self) -> Dict:
@@ -587,23 +1106,28 @@ class FootballDataHistoryService:
         This is a simplified calculation. In production, you'd use
         actual xG data from API-Football or Opta if available.
         """
-        if form_data.get("matches_count", 0) < 3:
-            return 1.5  # Default safe value
-        
-        avg_goals_scored = form_data.get("avg_goals_scored", 0.0)
-        form_percentage = form_data.get("form_percentage", 0.5)
-        
-        # Base xG from average goals
-        base_xg = avg_goals_scored
+        return float(self.calculate_xg_from_form_batch([form_data], np.array([is_home]))[0])
+    
+    def calculate_xg_from_form_batch(self, forms: List[Dict], is_home: np.ndarray) -> np.ndarray:
+        """
+        Estimate xG for many teams at once (see calculate_xg_from_form)
         
-        # Adjust for form (teams in better form score more)
-        form_factor = 0.8 + (form_percentage * 0.4)  # Range: 0.8 to 1.2
+        Args:
+            forms: Form dicts as returned by calculate_team_form
+            is_home: Boolean array, True where the team plays at home
         
-        # Home advantage (typically +0.2 to +0.3 xG)
-        home_advantage = 0.25 if is_home else 0.0
+        Returns:
+            float64 array of xG estimates, one per form
+        """
+        matches_count = np.fromiter((f.get("matches_count", 0) for f in forms), dtype=np.int32, count=len(forms))
+        avg_goals_scored = np.fromiter((f.get("avg_goals_scored", 0.0) for f in forms), dtype=np.float64, count=len(forms))
+        form_percentage = np.fromiter((f.get("form_percentage", 0.5) for f in forms), dtype=np.float64, count=len(forms))
         
-        estimated_xg = base_xg * form_factor + home_advantage
+        # Base xG from average goals, adjusted for form (teams in better form
+        # score more; range 0.8 to 1.2) plus home advantage (typically +0.2 to +0.3 xG)
+        form_factor = 0.8 + form_percentage * 0.4
+        home_advantage = np.where(np.asarray(is_home, dtype=bool), 0.25, 0.0)
+        estimated_xg = avg_goals_scored * form_factor + home_advantage
         
-        # Ensure reasonable bounds (0.5 to 3.0)
-        return max(0.5, min(3.0, estimated_xg))
-
+        # Ensure reasonable bounds (0.5 to 3.0); default safe value without enough matches
+        return np.where(matches_count < 3, 1.5, np.clip(estimated_xg, 0.5, 3.0))
@@ -4,25 +4,514 @@ Fetches today's matches from API-Football/Broadage and enriches with real statis
 """
 from typing import List, Dict
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Mapping, Optional, Tuple
+import asyncio
+import copy
+import importlib.util
+import json
 import logging
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+# httpx (optional - per-league requests fall back to a thread pool)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+# HTTP/2 multiplexes the concurrent fixture requests over one connection (needs h2)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# orjson (optional - faster JSON decoding of fixture payloads)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pysimdjson (optional - lazy parsing of the all-leagues fixtures response)
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+# ciso8601 (optional - C ISO 8601 parser for fixture kick-off times)
+try:
+    from ciso8601 import parse_datetime as _parse_dt
+    CISO8601_AVAILABLE = True
+except ImportError:
+    _parse_dt = datetime.fromisoformat
+    CISO8601_AVAILABLE = False
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 kick-off time; many fixtures share one, so results are cached"""
+    # Both parsers accept a trailing "Z" (fromisoformat since Python 3.11)
+    return _parse_dt(value)
+
+# diskcache (optional - fixture responses are cached in-process without it)
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
 
 # OddsAPI client (optional - fallback if not available)
 try:
     from src.services.odds_api_client import OddsAPIClient
 except ImportError:
     OddsAPIClient = None
+_UNSET = object()  # MatchFetcher.odds_client not built yet
 
 # Football-Data.org history service for real statistics
 try:
-    from src.services.football_data_history_service import FootballDataHistoryService
+    from src.services.football_data_history_service import FootballDataHistoryService, _MemoryCache, normalize_name
 except ImportError:
     FootballDataHistoryService = None
+    _MemoryCache = None
+    normalize_name = None
 
 logger = logging.getLogger(__name__)
 
+# Per-league fixture requests
+FIXTURE_TIMEOUT = 15
+FIXTURE_MAX_WORKERS = 8
+FIXTURE_POOL_SIZE = 16
+FIXTURE_CONNECTIONS_PER_HOST = 64
+FIXTURE_KEEPALIVE_CONNECTIONS = 20
+FIXTURE_RETRY_ATTEMPTS = 3
+FIXTURE_BACKOFF_FACTOR = 0.5
+FIXTURE_RETRY_STATUSES = (429, 500, 502, 503, 504)
+FIXTURE_RETRY_AFTER_MAX = 30  # Cap on a server-requested Retry-After wait (seconds)
+
+# Fixture response cache: fixtures around kick-off change (line-ups, postponements), the
+# rest of the day's rarely do, and past dates don't. Entries outlive their TTL so stale
+# ones can be revalidated via ETag.
+FIXTURE_CACHE_TTL = 300
+FIXTURE_CACHE_TTL_QUIET = 3600  # No fixture within FIXTURE_LIVE_WINDOW of kick-off
+FIXTURE_CACHE_TTL_PAST = 24 * 3600
+FIXTURE_LIVE_WINDOW = 3 * 3600
+FIXTURE_CACHE_RETENTION = 2 * 24 * 3600
+# Finished get_today_matches results (fixtures + odds + statistics), same cache store
+MATCHES_CACHE_TTL = 600
+# OddsAPI responses per league tier
+ODDS_CACHE_TTL = 300
+# Working Broadage endpoint, kept in the same store so restarts skip the endpoint probe
+BROADAGE_SOURCE_KEY = "broadage:source"
+BROADAGE_SOURCE_TTL = 7 * 24 * 3600
+
+# Bookmakers whose "Match Winner" odds we use, most preferred first
+PREFERRED_BOOKMAKERS = ("Bet365", "Pinnacle", "William Hill")
+# "Match Winner" outcome label -> odds key, and the odds used when one is missing
+VAL2KEY = {"Home": "home", "Draw": "draw", "Away": "away"}
+DEFAULT_ODDS = {"home": 2.0, "draw": 3.0, "away": 2.5}
+# OddsAPI cache entries: 1X2 prices copied onto the match, the rest go into market_odds
+_MATCH_ODDS_KEYS = ("home_odds", "draw_odds", "away_odds")
+_MARKET_KEYS = ("over_0.5_goals", "over_1.5_goals", "home_over_0.5", "away_over_0.5")
+_EMPTY_ODDS: Dict[str, float] = {}
+# market_odds shared by every match without OddsAPI data - read-only, never mutate it
+# (a plain dict rather than a MappingProxyType so the matches cache can deepcopy it)
+_EMPTY_MARKET_ODDS: Dict[str, Optional[float]] = dict.fromkeys(_MARKET_KEYS)
+# Abbreviations folded when matching OddsAPI team names to fixtures (after normalize_name)
+_TEAM_TOKEN_ALIASES = {"utd": "united", "man": "manchester"}
+
+# API-Football league ID -> league tier
+_LEAGUE_TIER: Mapping[int, str] = MappingProxyType({
+    # Top tier
+    39: "EPL",
+    140: "LaLiga",
+    78: "Bundesliga",
+    135: "SerieA",
+    61: "Ligue1",
+    88: "Eredivisie",
+    # More leagues
+    203: "SuperLig",
+    235: "PremierLeague_RU",
+    179: "LigaMX",
+    262: "MLS",
+    128: "PrimeiraLiga",
+    71: "SerieA_BR",
+    299: "J1League",
+    307: "KLeague1",
+    106: "Brasileirao",
+    144: "JupilerPro",
+    89: "Ekstraklasa",
+    103: "Superliga",
+    113: "Eliteserien",
+    119: "Allsvenskan",
+    94: "SuperLeague",
+    207: "SerieA_AR",
+})
+
+# Leagues fetched when none are given: top tiers, PLUS more leagues for days when big leagues don't play
+_DEFAULT_LEAGUES: Tuple[int, ...] = (
+    # Top tier leagues
+    39,   # EPL (England)
+    140,  # LaLiga (Spain)
+    78,   # Bundesliga (Germany)
+    135,  # SerieA (Italy)
+    61,   # Ligue1 (France)
+    88,   # Eredivisie (Netherlands)
+    # Add more leagues to ensure matches available daily
+    203,  # Super Lig (Turkey)
+    235,  # Premier League (Russia)
+    179,  # Liga MX (Mexico)
+    262,  # MLS (USA)
+    128,  # Primeira Liga (Portugal)
+    71,   # Serie A (Brazil)
+    40,   # Championship (England) - level 2
+    41,   # League 1 (England) - level 3
+    48,   # La Liga 2 (Spain)
+    79,   # 2. Bundesliga (Germany)
+    137,  # Serie B (Italy)
+    63,   # Ligue 2 (France)
+    # Smaller European leagues
+    299,  # J1 League (Japan)
+    307,  # K League 1 (South Korea)
+    106,  # Brasileirão (Brazil)
+    144,  # Jupiler Pro League (Belgium)
+    89,   # Ekstraklasa (Poland)
+    103,  # Superliga (Denmark)
+    113,  # Eliteserien (Norway)
+    119,  # Allsvenskan (Sweden)
+    94,   # Super League (Greece)
+    253,  # Mls Cup (if different)
+    207,  # Serie A (Argentina)
+)
+
+# Default stats for API-Football fixtures (in production, fetch detailed stats).
+# _parse_fixture copies the match template and fills in the per-fixture fields. The
+# default form dicts are shared by every parsed match: enrichment replaces them with
+# fresh dicts, so treat them as read-only (they stay plain dicts for JSON/DB storage).
+_DEFAULT_HOME_FORM = {
+    'goals_scored_5': 12,
+    'goals_conceded_5': 3,
+    'form_percentage': 0.85,
+    'shots_on_target_avg': 6.0,
+    'goals_variance': 5.0  # Low variance = predictable
+}
+_DEFAULT_AWAY_FORM = {
+    'goals_scored_5': 4,
+    'goals_conceded_5': 8,
+    'form_percentage': 0.3,
+    'shots_on_target_avg': 3.0,
+    'goals_variance': 6.0  # Low variance
+}
+_DEFAULT_MATCH = {
+    # None = per-fixture field filled in by _parse_fixture (listed to keep key order stable)
+    'id': None,
+    'home_team': None,
+    'away_team': None,
+    'league': None,
+    'league_tier': None,
+    'match_date': None,
+    'home_odds': None,
+    'draw_odds': None,
+    'away_odds': None,
+    'home_form': _DEFAULT_HOME_FORM,
+    'away_form': _DEFAULT_AWAY_FORM,
+    
+    'home_xg': 2.1,
+    'away_xg': 0.8,
+    'home_position': 3,
+    'away_position': 20,
+    'league_size': 20,
+    'table_gap': 17,
+    'pressure_index': 0.4,  # Low pressure
+    'is_derby': False,
+    'is_must_win': False,
+    'key_player_missing': False,
+    'fixture_congestion': 7,
+    'home_fixture_congestion': 7,
+    'away_fixture_congestion': 7
+}
+
+# Broadage defaults - Broadage might provide more detailed stats. Same sharing rules as above.
+_BROADAGE_HOME_FORM = {
+    'goals_scored_5': 10,
+    'goals_conceded_5': 4,
+    'form_percentage': 0.7,
+    'shots_on_target_avg': 5.0,
+    'goals_variance': 5.0
+}
+_BROADAGE_AWAY_FORM = {
+    'goals_scored_5': 8,
+    'goals_conceded_5': 5,
+    'form_percentage': 0.65,
+    'shots_on_target_avg': 4.5,
+    'goals_variance': 6.0
+}
+_DEFAULT_BROADAGE_MATCH = {
+    # None = per-fixture field filled in by _parse_broadage_fixture
+    'id': None,
+    'home_team': None,
+    'away_team': None,
+    'league': None,
+    'league_tier': None,
+    'match_date': None,
+    'home_odds': None,
+    'draw_odds': None,
+    'away_odds': None,
+    'home_form': _BROADAGE_HOME_FORM,
+    'away_form': _BROADAGE_AWAY_FORM,
+    'home_xg': 1.8,
+    'away_xg': 1.5,
+    'home_position': 8,
+    'away_position': 12,
+    'league_size': 20,
+    'table_gap': 4,
+    'pressure_index': 0.5,
+    'is_derby': False,
+    'is_must_win': False,
+    'key_player_missing': False,
+    'fixture_congestion': 7,
+    'home_fixture_congestion': 7,
+    'away_fixture_congestion': 7
+}
+
+# Broadage field aliases, in lookup order (payloads vary between endpoints)
+_BROADAGE_HOME_KEYS = ("homeTeam", "home_team", "home")
+_BROADAGE_AWAY_KEYS = ("awayTeam", "away_team", "away")
+_BROADAGE_TEAM_NAME_KEYS = ("name", "shortName", "mediumName")
+_BROADAGE_LEAGUE_KEYS = ("league", "tournament")
+_BROADAGE_LEAGUE_NAME_KEYS = ("name", "shortName")
+_BROADAGE_LEAGUE_ID_KEYS = ("leagueId", "league_id", "tournamentId")
+_BROADAGE_DATE_KEYS = ("date", "startTime", "matchDate", "kickoff")
+
+# Column dtypes for the columnar match views. Positions, gaps and congestion fit in int8;
+# form stats are flattened into home_/away_ prefixed columns.
+_MATCH_TEXT_COLUMNS = ('id', 'home_team', 'away_team', 'league', 'league_tier')
+_MATCH_NUMERIC_COLUMNS = {
+    'home_odds': np.float32,
+    'draw_odds': np.float32,
+    'away_odds': np.float32,
+    'home_xg': np.float32,
+    'away_xg': np.float32,
+    'home_position': np.int8,
+    'away_position': np.int8,
+    'league_size': np.int8,
+    'table_gap': np.int8,
+    'pressure_index': np.float32,
+    'is_derby': np.bool_,
+    'is_must_win': np.bool_,
+    'key_player_missing': np.bool_,
+    'fixture_congestion': np.int8,
+    'home_fixture_congestion': np.int8,
+    'away_fixture_congestion': np.int8,
+}
+_MATCH_FORM_COLUMNS = {
+    'goals_scored_5': np.int16,
+    'goals_conceded_5': np.int16,
+    'form_percentage': np.float32,
+    'shots_on_target_avg': np.float32,
+    'goals_variance': np.float32,
+}
+# One packed record per match holding every numeric field (text fields stay separate)
+MATCH_RECORD_DTYPE = np.dtype(
+    list(_MATCH_NUMERIC_COLUMNS.items())
+    + [(f'{side}_{col}', dtype) for side in ('home', 'away') for col, dtype in _MATCH_FORM_COLUMNS.items()]
+)
+
+
+@dataclass(slots=True)
+class FormStats:
+    """A team's recent form; the optional fields are only set by real-stats enrichment"""
+    goals_scored_5: int
+    goals_conceded_5: int
+    form_percentage: float
+    shots_on_target_avg: float
+    goals_variance: float
+    wins: Optional[int] = None
+    draws: Optional[int] = None
+    losses: Optional[int] = None
+    form_string: Optional[str] = None
+    points_5: Optional[int] = None
+    clean_sheets: Optional[int] = None
+    matches_count: Optional[int] = None
+    avg_goals_scored: Optional[float] = None
+    avg_goals_conceded: Optional[float] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FormStats":
+        return cls(**{name: data[name] for name in _FORM_FIELDS if name in data})
+    
+    def as_dict(self) -> Dict:
+        values = ((name, getattr(self, name)) for name in _FORM_FIELDS)
+        return {name: value for name, value in values if value is not None}
+
+
+@dataclass(slots=True)
+class Match:
+    """
+    Slotted, typed form of a match dict (see get_today_matches_typed)
+    
+    Keys outside the fixed schema (h2h, market_odds, _stats_source, ...) are kept in
+    `extras`, so Match.from_dict(m).as_dict() == m.
+    """
+    id: str
+    home_team: str
+    away_team: str
+    league: str
+    league_tier: str
+    match_date: datetime
+    home_odds: float
+    draw_odds: float
+    away_odds: float
+    home_form: FormStats
+    away_form: FormStats
+    home_xg: float
+    away_xg: float
+    home_position: int
+    away_position: int
+    league_size: int
+    table_gap: int
+    pressure_index: float
+    is_derby: bool
+    is_must_win: bool
+    key_player_missing: bool
+    fixture_congestion: int
+    home_fixture_congestion: int
+    away_fixture_congestion: int
+    extras: Dict = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Match":
+        values = {name: data[name] for name in _MATCH_FIELDS}
+        values['home_form'] = FormStats.from_dict(data['home_form'])
+        values['away_form'] = FormStats.from_dict(data['away_form'])
+        values['extras'] = {k: v for k, v in data.items() if k not in _MATCH_FIELD_SET}
+        return cls(**values)
+    
+    def as_dict(self) -> Dict:
+        data = {name: getattr(self, name) for name in _MATCH_FIELDS}
+        data['home_form'] = self.home_form.as_dict()
+        data['away_form'] = self.away_form.as_dict()
+        data.update(self.extras)
+        return data
+
+
+_FORM_FIELDS = tuple(f.name for f in fields(FormStats))
+_MATCH_FIELDS = tuple(f.name for f in fields(Match) if f.name != 'extras')
+_MATCH_FIELD_SET = frozenset(_MATCH_FIELDS)
+
+
+def _loads(content):
+    """Decode a JSON response body (bytes or str), using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# simdjson parsers reuse their buffers across documents, so keep one per thread
+_simdjson_local = threading.local()
+
+
+def _materialize(value):
+    """Convert a simdjson proxy (or plain value) into Python objects"""
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+def _loads_fixtures(content: bytes, leagues=None) -> Dict:
+    """
+    Decode a /fixtures body, keeping only fixtures whose league is in `leagues`
+    
+    With pysimdjson the document is parsed lazily: fixtures from other leagues are
+    skipped without being turned into dicts, which matters for the all-leagues
+    response where most fixtures are discarded. Without it, or without a league
+    filter, the whole body is decoded with _loads.
+    """
+    if leagues is None or not SIMDJSON_AVAILABLE:
+        return _loads(content)
+    parser = getattr(_simdjson_local, "parser", None)
+    if parser is None:
+        parser = _simdjson_local.parser = simdjson.Parser()
+    doc = parser.parse(content)
+    if not isinstance(doc, simdjson.Object):
+        return _materialize(doc)
+    
+    fixtures = doc.get("response")
+    if isinstance(fixtures, simdjson.Array):
+        kept = []
+        for fixture in fixtures:
+            league = fixture.get("league") if isinstance(fixture, simdjson.Object) else None
+            if isinstance(league, simdjson.Object) and league.get("id") in leagues:
+                kept.append(fixture.as_dict())
+        fixtures = kept
+    else:
+        fixtures = _materialize(fixtures)
+    # Materialize everything before the parser is reused
+    return {
+        "errors": _materialize(doc.get("errors")),
+        "results": _materialize(doc.get("results")),
+        "response": fixtures,
+    }
+
+
+def _first(data: Dict, keys: Tuple[str, ...], default=None):
+    """First truthy value among `keys` in `data`, else `default`"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return default
+
+
+@lru_cache(maxsize=2048)
+def _norm_team(name: str) -> str:
+    """Canonical team name, so OddsAPI and fixture spellings ("Man Utd" / "Manchester United") agree"""
+    name = normalize_name(name) if normalize_name else " ".join(name.lower().split())
+    return " ".join(_TEAM_TOKEN_ALIASES.get(token, token) for token in name.split())
+
+
+def _odds_key(home_team: str, away_team: str) -> Tuple[str, str]:
+    """_odds_cache key for a fixture"""
+    return _norm_team(home_team), _norm_team(away_team)
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait before retrying: Retry-After (in seconds) if given, else exponential backoff"""
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), FIXTURE_RETRY_AFTER_MAX)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return FIXTURE_BACKOFF_FACTOR * (2 ** attempt)
+
+
+def _open_fixture_cache():
+    """
+    Cache for /fixtures responses: on disk if diskcache is installed, otherwise in-process
+    (which still lets stale entries be revalidated with ETags). None if disabled.
+    """
+    if os.getenv("FIXTURE_CACHE_ENABLED", "true").lower() != "true":
+        return None
+    if DISKCACHE_AVAILABLE:
+        cache_dir = os.getenv("FIXTURE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "football_fixture_cache"))
+        try:
+            return diskcache.Cache(cache_dir, size_limit=50 << 20)
+        except Exception as e:
+            logger.warning(f"Could not open fixture cache in {cache_dir} ({e}), using in-memory cache")
+    return _MemoryCache() if _MemoryCache else None
+
 
 class MatchFetcher:
     """Fetches matches from API-Football or Broadage API"""
@@ -47,14 +536,14 @@ class MatchFetcher:
             # languageId as header (if not working, we'll try as param)
             self.language_id_header = str(self.language_id)
             
-            print("🌐 Using Broadage API")
-            print(f"   Base URL (full): {self.base_url}")
-            print(f"   Base URL length: {len(self.base_url)} chars")
-            print(f"   Expected: https://s0-sports-data-api.broadage.com")
-            print(f"   Language ID: {self.language_id}")
+            logger.info("🌐 Using Broadage API")
+            logger.info(f"   Base URL (full): {self.base_url}")
+            logger.info(f"   Base URL length: {len(self.base_url)} chars")
+            logger.info("   Expected: https://s0-sports-data-api.broadage.com")
+            logger.info(f"   Language ID: {self.language_id}")
             if "s0-sports-data-api.broadage.com" not in self.base_url:
-                print(f"   ⚠️  WARNING: Base URL doesn't match expected format!")
-                print(f"   ⚠️  Check BROADAGE_API_URL environment variable in Coolify")
+                logger.warning("   ⚠️  WARNING: Base URL doesn't match expected format!")
+                logger.warning("   ⚠️  Check BROADAGE_API_URL environment variable in Coolify")
         else:
             self.api_key = os.getenv("API_FOOTBALL_KEY", "")
             self.base_url = "https://v3.football.api-sports.io"
@@ -62,12 +551,39 @@ class MatchFetcher:
                 "x-rapidapi-key": self.api_key,
                 "x-rapidapi-host": "v3.football.api-sports.io"
             }
-            print("🌐 Using API-Football")
-        # Initialize OddsAPI client (optional)
-        self.odds_client = OddsAPIClient() if OddsAPIClient else None
-        # Cache odds for today's matches
-        self._odds_cache = {}
-        self._odds_fetched = False
+            logger.info("🌐 Using API-Football")
+        
+        # Pooled keep-alive connections shared by every league request; 429/5xx retried with backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=FIXTURE_RETRY_ATTEMPTS,
+            backoff_factor=FIXTURE_BACKOFF_FACTOR,
+            status_forcelist=FIXTURE_RETRY_STATUSES,
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,  # 429s from API-Football say how long to wait
+            raise_on_status=False  # Hand the last response back so it's reported per league
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=FIXTURE_POOL_SIZE,
+                                                   pool_maxsize=FIXTURE_POOL_SIZE, max_retries=retry))
+        
+        # OddsAPI client (optional), constructed on first use - see odds_client
+        self._odds_client = _UNSET
+        # Cache odds for today's matches, keyed by normalized (home, away) - see _odds_key
+        self._odds_cache: Dict[Tuple[str, str], Dict] = {}
+        # (league tier, date) -> (fetched_at, OddsAPI response)
+        self._odds_league_cache: Dict[Tuple[str, str], Tuple[float, object]] = {}
+        # Date the odds cache was filled for; a new day starts a fresh cache
+        self._odds_fetched_for: Optional[str] = None
+        # (date, league, season) -> /fixtures response, plus finished get_today_matches results;
+        # FIXTURE_CACHE_ENABLED=false bypasses it
+        self._fixture_cache = _open_fixture_cache()
+        # Worker threads for per-league requests, created on first use and kept across calls (_get_executor)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Broadage (endpoint, auth config name) found by the endpoint probe, tried first next time
+        self._broadage_endpoint: Optional[Tuple[str, str]] = None
+        # httpx client for aget_today_matches, created on first use (bound to that event loop)
+        self._async_client = None
         
         # Initialize Football-Data.org history service for real statistics
         self.history_service = FootballDataHistoryService() if FootballDataHistoryService else None
@@ -76,6 +592,38 @@ class MatchFetcher:
         else:
             logger.warning("⚠️ Football-Data.org history service not available - using defaults")
     
+    @property
+    def odds_client(self):
+        """OddsAPI client, or None if it isn't available; only built once odds are first needed"""
+        if self._odds_client is _UNSET:
+            self._odds_client = OddsAPIClient() if OddsAPIClient else None
+        return self._odds_client
+    
+    @odds_client.setter
+    def odds_client(self, client):
+        self._odds_client = client
+    
+    def close(self):
+        """Release pooled HTTP connections and worker threads"""
+        self.session.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    async def aclose(self):
+        """Close the async HTTP clients used by aget_today_matches"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self.history_service:
+            await self.history_service.aclose()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
     def get_today_matches(self, leagues: Optional[List[int]] = None) -> List[Dict]:
         """
         Fetch today's matches from API-Football/Broadage and enrich with real statistics
@@ -90,11 +638,99 @@ class MatchFetcher:
             - Real xG calculated from historical data
             - Real odds (if available)
         """
+        request = self._match_day(leagues)
+        if request is None:
+            return []
+        today, season_year, leagues = request
+        cache_key = self._matches_cache_key(today, leagues)
+        cached = self._cached_matches(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Fetch matches from selected API
+        basic_matches = self._fetch_basic_matches(today, season_year, leagues)
+        
+        # Enrich matches with real statistics from Football-Data.org
+        if basic_matches and self.history_service:
+            logger.info(f"Enriching {len(basic_matches)} matches with real statistics...")
+            enriched_matches = []
+            for match in basic_matches:
+                enriched = self._enrich_match_with_statistics(match)
+                enriched_matches.append(enriched)
+            basic_matches = enriched_matches
+        
+        self._store_matches(cache_key, basic_matches)
+        return basic_matches
+    
+    async def aget_today_matches(self, leagues: Optional[List[int]] = None) -> List[Dict]:
+        """
+        Async variant of get_today_matches for callers already running an event loop
+        
+        League requests go out concurrently over one long-lived httpx client (HTTP/2 when
+        h2 is installed) and matches are enriched concurrently via the history service's
+        async API. Call aclose() when done.
+        """
+        request = self._match_day(leagues)
+        if request is None:
+            return []
+        today, season_year, leagues = request
+        cache_key = self._matches_cache_key(today, leagues)
+        cached = self._cached_matches(cache_key)
+        if cached is not None:
+            return cached
+        
+        if self.use_broadage or not HTTPX_AVAILABLE:
+            basic_matches = await asyncio.to_thread(self._fetch_basic_matches, today, season_year, leagues)
+        else:
+            basic_matches = await self._fetch_from_api_football_async(today, season_year, leagues)
+        
+        if basic_matches and self.history_service:
+            logger.info(f"Enriching {len(basic_matches)} matches with real statistics...")
+            basic_matches = list(await asyncio.gather(
+                *(self._enrich_match_with_statistics_async(match) for match in basic_matches)
+            ))
+        
+        self._store_matches(cache_key, basic_matches)
+        return basic_matches
+    
+    def _matches_cache_key(self, today: str, leagues: List[int]) -> str:
+        source = "broadage" if self.use_broadage else "api-football"
+        return f"matches:{today}:{source}:" + ",".join(map(str, sorted(set(leagues))))
+    
+    def _cached_matches(self, key: str) -> Optional[List[Dict]]:
+        """Matches from a get_today_matches call in the last MATCHES_CACHE_TTL seconds, if any"""
+        if self._fixture_cache is None:
+            return None
+        matches = self._fixture_cache.get(key)
+        if matches is None:
+            return None
+        logger.info(f"Using {len(matches)} cached matches ({key})")
+        # Callers mutate the match dicts; the in-memory cache hands back the stored objects
+        return copy.deepcopy(matches)
+    
+    def _store_matches(self, key: str, matches: List[Dict]) -> None:
+        # Empty results usually mean an API problem, so don't pin them for the TTL
+        if self._fixture_cache is None or not matches:
+            return
+        self._fixture_cache.set(key, copy.deepcopy(matches), expire=MATCHES_CACHE_TTL)
+    
+    def _fetch_basic_matches(self, today: str, season_year: int, leagues: List[int]) -> List[Dict]:
+        """Fetch today's matches from the selected API, without statistics"""
+        if self.use_broadage:
+            return self._fetch_from_broadage(today, leagues)
+        return self._fetch_from_api_football(today, season_year, leagues)
+    
+    def _match_day(self, leagues: Optional[List[int]]) -> Optional[Tuple[str, int, List[int]]]:
+        """
+        Resolve today's date, the current season and the leagues to fetch
+        
+        Returns None if no API key is configured.
+        """
         if not self.api_key:
             api_key_name = "BROADAGE_API_KEY" if self.use_broadage else "API_FOOTBALL_KEY"
-            print(f"⚠️ {api_key_name} not set! Cannot fetch real matches.")
-            print(f"   Please set {api_key_name} environment variable in Coolify")
-            return []
+            logger.warning(f"⚠️ {api_key_name} not set! Cannot fetch real matches.")
+            logger.warning(f"   Please set {api_key_name} environment variable in Coolify")
+            return None
         
         # Get current date - check system time
         now = datetime.now()
@@ -102,7 +738,7 @@ class MatchFetcher:
         current_year = now.year
         current_month = now.month
         
-        print(f"📅 System date: {today} (Year: {current_year}, Month: {current_month})")
+        logger.info(f"📅 System date: {today} (Year: {current_year}, Month: {current_month})")
         
         # Determine current season - European leagues run Aug-May
         # If month is Aug-Dec, season = current year; if Jan-Jul, season = previous year
@@ -113,70 +749,75 @@ class MatchFetcher:
         
         # API-Football free plan limitation: Only supports seasons 2021-2023
         # If we need a newer season, we'll get an error and can handle it
-        print(f"🔍 Fetching matches for {today} from API-Football (season: {season_year})...")
-        print(f"   ⚠️ Note: Free plan only supports seasons 2021-2023")
-        print(f"   💡 If season {season_year} fails, you need a paid API-Football plan")
+        logger.info(f"🔍 Fetching matches for {today} from API-Football (season: {season_year})...")
+        logger.info("   ⚠️ Note: Free plan only supports seasons 2021-2023")
+        logger.info(f"   💡 If season {season_year} fails, you need a paid API-Football plan")
         
-        # Default to top leagues if not specified, PLUS more leagues for days when big leagues don't play
+        # Default to top leagues if not specified
         if not leagues:
-            # Top tier leagues
-            leagues = [
-                39,   # EPL (England)
-                140,  # LaLiga (Spain)
-                78,   # Bundesliga (Germany)
-                135,  # SerieA (Italy)
-                61,   # Ligue1 (France)
-                88,   # Eredivisie (Netherlands)
-                # Add more leagues to ensure matches available daily
-                203,  # Super Lig (Turkey)
-                235,  # Premier League (Russia)
-                179,  # Liga MX (Mexico)
-                262,  # MLS (USA)
-                128,  # Primeira Liga (Portugal)
-                71,   # Serie A (Brazil)
-                40,   # Championship (England) - level 2
-                41,   # League 1 (England) - level 3
-                48,   # La Liga 2 (Spain)
-                79,   # 2. Bundesliga (Germany)
-                137,  # Serie B (Italy)
-                63,   # Ligue 2 (France)
-                # Smaller European leagues
-                40,   # League Two (England)
-                299,  # J1 League (Japan)
-                307,  # K League 1 (South Korea)
-                106,  # Brasileirão (Brazil)
-                144,  # Jupiler Pro League (Belgium)
-                89,   # Ekstraklasa (Poland)
-                103,  # Superliga (Denmark)
-                113,  # Eliteserien (Norway)
-                119,  # Allsvenskan (Sweden)
-                94,   # Super League (Greece)
-                253,  # Mls Cup (if different)
-                207,  # Serie A (Argentina)
-            ]
-        
-        all_matches = []
+            leagues = _DEFAULT_LEAGUES
+        # Drop repeated IDs (keeping the caller's order) so no league is fetched twice
+        leagues = list(dict.fromkeys(leagues))
+
+        return today, season_year, leagues
+    
+    def get_today_matches_df(self, leagues: Optional[List[int]] = None) -> pd.DataFrame:
+        """
+        Fetch today's matches as a DataFrame, one row per match
         
-        # Fetch matches from selected API
-        if self.use_broadage:
-            basic_matches = self._fetch_from_broadage(today, leagues)
-        else:
-            basic_matches = self._fetch_from_api_football(today, season_year, leagues)
+        Columnar counterpart of get_today_matches for vectorized consumers: numeric
+        fields use compact dtypes (float32 odds/xG, int8 positions, bool flags) and form
+        stats become home_/away_ prefixed columns. Nested extras (h2h, market_odds) are
+        only available from get_today_matches.
+        """
+        return self._matches_to_frame(self.get_today_matches(leagues))
+    
+    def get_today_matches_typed(self, leagues: Optional[List[int]] = None) -> List[Match]:
+        """
+        Fetch today's matches as slotted Match objects
         
-        # Enrich matches with real statistics from Football-Data.org
-        if basic_matches and self.history_service:
-            logger.info(f"Enriching {len(basic_matches)} matches with real statistics...")
-            enriched_matches = []
-            for match in basic_matches:
-                enriched = self._enrich_match_with_statistics(match)
-                enriched_matches.append(enriched)
-            return enriched_matches
+        Same data as get_today_matches in a more compact form for callers that hold
+        many matches; Match.as_dict() converts back.
+        """
+        return [Match.from_dict(m) for m in self.get_today_matches(leagues)]
+    
+    def get_today_matches_records(self, leagues: Optional[List[int]] = None) -> np.ndarray:
+        """
+        Fetch today's numeric match fields as a MATCH_RECORD_DTYPE structured array
         
-        return basic_matches
+        Rows are in get_today_matches order; use get_today_matches_df for team/league names.
+        """
+        return self._matches_to_records(self.get_today_matches(leagues))
+    
+    @staticmethod
+    def _matches_to_records(matches: List[Dict]) -> np.ndarray:
+        """Pack each match's numeric fields into one MATCH_RECORD_DTYPE record"""
+        records = np.empty(len(matches), dtype=MATCH_RECORD_DTYPE)
+        numeric_cols = tuple(_MATCH_NUMERIC_COLUMNS)
+        form_cols = tuple(_MATCH_FORM_COLUMNS)
+        for i, m in enumerate(matches):
+            home_form = m.get('home_form') or {}
+            away_form = m.get('away_form') or {}
+            records[i] = (
+                tuple(m.get(col) or 0 for col in numeric_cols)
+                + tuple(home_form.get(col) or 0 for col in form_cols)
+                + tuple(away_form.get(col) or 0 for col in form_cols)
+            )
+        return records
+    
+    @classmethod
+    def _matches_to_frame(cls, matches: List[Dict]) -> pd.DataFrame:
+        """Convert match dicts to a column-per-field DataFrame"""
+        columns = {col: pd.Series([m.get(col) for m in matches], dtype=object) for col in _MATCH_TEXT_COLUMNS}
+        # Broadage and fallback dates are naive; treat them as UTC like API-Football's
+        columns['match_date'] = pd.to_datetime([m.get('match_date') for m in matches], utc=True)
+        records = cls._matches_to_records(matches)
+        for col in MATCH_RECORD_DTYPE.names:
+            columns[col] = records[col]
+        return pd.DataFrame(columns)
     
     def _fetch_from_broadage(self, today: str, leagues: List[int]) -> List[Dict]:
         """Fetch matches from Broadage API"""
-        api_errors = []
         all_matches = []
         
         # Broadage API endpoints - based on their documentation structure
@@ -184,7 +825,7 @@ class MatchFetcher:
         # Soccer/Football sport ID is 1 (from their docs)
         # Try multiple endpoint patterns and authentication methods
         
-        print(f"📡 Fetching matches from Broadage API for {today}...")
+        logger.info(f"📡 Fetching matches from Broadage API for {today}...")
         
         # Based on Broadage Soccer API docs:
         # - Endpoints may be case-sensitive (TournamentFixture shows capital F)
@@ -193,6 +834,9 @@ class MatchFetcher:
         
         matches_data = []
         api_errors = []
+        best_matches = []
+        best_config_used = None
+        best_endpoint_used = None
         
         # Try exact endpoint paths from Broadage docs (case-sensitive)
         # Based on error: /soccer/match/list exists but returns "Language is invalid"
@@ -205,18 +849,21 @@ class MatchFetcher:
             f"{self.base_url}/soccer/MatchList/Live",  # Live matches (only currently playing)
         ]
         
+        # Parse today once; the date filter below compares every returned match against it
+        today_date = datetime.strptime(today, "%Y-%m-%d").date()
+        today_dd_mm_yyyy = today_date.strftime("%d/%m/%Y")
+        
         # Try date parameter variations (Broadage might use different date formats)
         date_formats = [
             today,  # YYYY-MM-DD
             today.replace("-", "/"),  # YYYY/MM/DD
-            datetime.strptime(today, "%Y-%m-%d").strftime("%d/%m/%Y"),  # DD/MM/YYYY
+            today_dd_mm_yyyy,  # DD/MM/YYYY
         ]
         
         # Based on error: "Language is invalid" for languageId=1 and 0
         # "Language Id is mandatory" - must include it
         # Solution: Try languageId values 2, 3, 4, etc. until we find a valid one
         # Trial subscriptions often only allow specific language IDs (not 1 or 0)
-        today_dd_mm_yyyy = datetime.strptime(today, "%Y-%m-%d").strftime("%d/%m/%Y")
         
         # Start with the configured languageId (default 2, which works for trial)
         # If that fails, try other values
@@ -257,17 +904,31 @@ class MatchFetcher:
                 "params": {"date": today_dd_mm_yyyy}
             })
         
+        # Endpoint + config that worked last time go first; if they still answer 200 we stop there
+        known_source = self._broadage_source()
+        if known_source:
+            known_endpoint, known_config_name = known_source
+            known_config = next((c for c in auth_configs if c["name"] == known_config_name), None)
+            if known_endpoint in possible_endpoints and known_config:
+                possible_endpoints.remove(known_endpoint)
+                possible_endpoints.insert(0, known_endpoint)
+                auth_configs.remove(known_config)
+                auth_configs.insert(0, known_config)
+            else:
+                known_source = None
+        
         # Try each endpoint with authentication configs
         # Stop immediately when we find a working languageId
+        settled = False
         for endpoint in possible_endpoints:
             for config in auth_configs:
                 try:
-                    print(f"  📡 Calling: {endpoint}")
-                    print(f"     Config: {config['name']}")
-                    print(f"     Headers: Ocp-Apim-Subscription-Key={self.api_key[:10]}..., languageId={self.language_id}")
-                    print(f"     Params: {config['params']}")
+                    logger.debug("  📡 Calling: %s", endpoint)
+                    logger.debug("     Config: %s", config['name'])
+                    logger.debug("     Headers: Ocp-Apim-Subscription-Key=%s..., languageId=%s", self.api_key[:10], self.language_id)
+                    logger.debug("     Params: %s", config['params'])
                     
-                    response = requests.get(
+                    response = self.session.get(
                         endpoint, 
                         headers=config['headers'], 
                         params=config['params'], 
@@ -275,10 +936,10 @@ class MatchFetcher:
                     )
                     
                     if response.status_code == 200:
-                        data = response.json()
-                        print(f"  ✅ Success! Endpoint: {endpoint}")
-                        print(f"  ✅ Config that worked: {config['name']}")
-                        print(f"  🔍 Response structure: {list(data.keys())[:5] if isinstance(data, dict) else 'Array'}...")
+                        data = _loads(response.content)
+                        logger.info("  ✅ Success! Endpoint: %s", endpoint)
+                        logger.debug("  ✅ Config that worked: %s", config['name'])
+                        logger.debug("  🔍 Response structure: %s...", list(data.keys())[:5] if isinstance(data, dict) else 'Array')
                         
                         # Parse Broadage response based on their API structure
                         # Response could be array of matches or wrapped in object
@@ -312,9 +973,9 @@ class MatchFetcher:
                                             date_part = str(match_date).split()[0]
                                             parsed_date = datetime.strptime(date_part, "%d/%m/%Y")
                                         else:
-                                            parsed_date = datetime.fromisoformat(str(match_date).replace("Z", "+00:00"))
+                                            parsed_date = _parse_iso(str(match_date))
                                         
-                                        if parsed_date.date() == datetime.strptime(today, "%Y-%m-%d").date():
+                                        if parsed_date.date() == today_date:
                                             filtered_matches.append(match)
                                     except Exception as e:
                                         # If date parsing fails, include the match (might be today)
@@ -326,11 +987,11 @@ class MatchFetcher:
                                 matches_data = filtered_matches
                             # If no filtered matches but we have data, it might be that dates don't match format
                             # In that case, keep all matches (they might all be for today)
-                            print(f"  📊 After date filtering: {len(matches_data)} matches")
+                            logger.info("  📊 After date filtering: %s matches", len(matches_data))
                         
-                        print(f"  ✅ Found {len(matches_data)} matches from Broadage for {today}")
-                        print(f"  🎉 Working languageId: {config['headers'].get('languageId')}")
-                        print(f"  📊 Config used: {config['name']}")
+                        logger.info("  ✅ Found %s matches from Broadage for %s", len(matches_data), today)
+                        logger.debug("  🎉 Working languageId: %s", config['headers'].get('languageId'))
+                        logger.debug("  📊 Config used: %s", config['name'])
                         
                         # Store best result
                         if not best_matches or len(matches_data) > len(best_matches):
@@ -340,10 +1001,15 @@ class MatchFetcher:
                         
                         # If we got good number of matches, use this
                         if len(matches_data) >= 10:
-                            print(f"  ✅ Got {len(matches_data)} matches - using this config!")
+                            logger.info("  ✅ Got %s matches - using this config!", len(matches_data))
+                            settled = True
                             break  # Got enough matches, use this config
+                        elif known_source == (endpoint, config['name']):
+                            logger.info("  ✅ Known Broadage endpoint still works - skipping discovery")
+                            settled = True
+                            break
                         else:
-                            print(f"  ⚠️ Only {len(matches_data)} matches - will try other configs for more...")
+                            logger.debug("  ⚠️ Only %s matches - will try other configs for more...", len(matches_data))
                             # Continue to try other configs to get more matches
                             continue
                         
@@ -352,7 +1018,7 @@ class MatchFetcher:
                         try:
                             # Try JSON first
                             try:
-                                error_json = response.json()
+                                error_json = _loads(response.content)
                                 error_body = str(error_json)
                             except:
                                 error_body = response.text[:1000] if response.text else "No response body"
@@ -366,33 +1032,33 @@ class MatchFetcher:
                         
                         error_msg = f"401 Unauthorized - {config['name']}"
                         api_errors.append(error_msg)
-                        print(f"  ❌ {error_msg}")
-                        print(f"     Response body: {error_body}")
-                        print(f"     Response headers: {response_headers}")
+                        logger.error("  ❌ %s", error_msg)
+                        logger.debug("     Response body: %s", error_body)
+                        logger.debug("     Response headers: %s", response_headers)
                         if error_message:
-                            print(f"     ⚠️ API Error Message: {error_message} (Code: {error_code})")
+                            logger.warning("     ⚠️ API Error Message: %s (Code: %s)", error_message, error_code)
                             if "Language is invalid" in error_message:
-                                print(f"     💡 languageId={config['headers'].get('languageId', 'NOT SET')} is not valid for your subscription")
-                                print(f"     💡 Check Broadage dashboard for available language IDs")
-                        print(f"     Request headers sent: {config['headers']}")
-                        print(f"     API key preview: {self.api_key[:15]}... (length: {len(self.api_key)})")
+                                logger.warning("     💡 languageId=%s is not valid for your subscription", config['headers'].get('languageId', 'NOT SET'))
+                                logger.warning("     💡 Check Broadage dashboard for available language IDs")
+                        logger.debug("     Request headers sent: %s", config['headers'])
+                        logger.debug("     API key preview: %s... (length: %d)", self.api_key[:15], len(self.api_key))
                         
                         # Check for specific error indicators
                         error_lower = (error_body + error_message).lower()
                         if "subscription" in error_lower or "key" in error_lower:
-                            print(f"     ⚠️ API key authentication issue detected")
+                            logger.warning("     ⚠️ API key authentication issue detected")
                         if "language" in error_lower or "Language is invalid" in error_message:
-                            print(f"     ⚠️ languageId value issue - try different language ID or check dashboard")
+                            logger.warning("     ⚠️ languageId value issue - try different language ID or check dashboard")
                         if "ip" in error_lower or "whitelist" in error_lower:
-                            print(f"     ⚠️ IP whitelist issue detected")
+                            logger.warning("     ⚠️ IP whitelist issue detected")
                         if not error_body or error_body == "No response body":
-                            print(f"     ⚠️ Empty response body but error in headers")
+                            logger.warning("     ⚠️ Empty response body but error in headers")
                         
                         continue
                         
                     elif response.status_code == 404:
-                        print(f"  ⚠️ 404 Not Found - {config['name']}")
-                        print(f"     This endpoint might not exist or requires different parameters")
+                        logger.warning("  ⚠️ 404 Not Found - %s", config['name'])
+                        logger.warning("     This endpoint might not exist or requires different parameters")
                         continue
                         
                     elif response.status_code == 403:
@@ -404,9 +1070,9 @@ class MatchFetcher:
                         
                         error_msg = "403 Forbidden - IP not whitelisted"
                         api_errors.append(error_msg)
-                        print(f"  ❌ {error_msg}")
-                        print(f"     Response: {error_body}")
-                        print(f"     💡 Add your server IP (84.54.23.80) to Broadage whitelist")
+                        logger.error("  ❌ %s", error_msg)
+                        logger.debug("     Response: %s", error_body)
+                        logger.warning("     💡 Add your server IP (84.54.23.80) to Broadage whitelist")
                         break  # IP issue
                         
                     else:
@@ -416,35 +1082,37 @@ class MatchFetcher:
                         except:
                             error_body = "Could not read response body"
                         
-                        print(f"  ⚠️ HTTP {response.status_code} - {config['name']}")
-                        print(f"     Response: {error_body}")
+                        logger.warning("  ⚠️ HTTP %s - %s", response.status_code, config['name'])
+                        logger.debug("     Response: %s", error_body)
                         continue
                         
                 except Exception as e:
-                    import traceback
-                    print(f"  ❌ Error with {endpoint} ({config['name']}): {e}")
-                    print(f"     Traceback: {traceback.format_exc()[:200]}")
+                    logger.error("  ❌ Error with %s (%s): %s", endpoint, config['name'], e)
+                    # Stack formatting only happens when DEBUG logging is enabled
+                    logger.debug("Broadage request to %s failed", endpoint, exc_info=True)
                     continue
             
             # If we found matches with this endpoint, check if we should continue
-            if matches_data and len(matches_data) >= 10:
+            if settled:
                 break  # Got enough matches, stop trying
         
         # Use best matches if we found any
         if best_matches:
+            self._remember_broadage_source(best_endpoint_used, best_config_used['name'])
             matches_data = best_matches
-            print(f"\n📊 Using best result: {len(matches_data)} matches from {best_endpoint_used}")
-            print(f"   Config: {best_config_used['name'] if best_config_used else 'N/A'}")
+            logger.info(f"📊 Using best result: {len(matches_data)} matches from {best_endpoint_used}")
+            logger.info(f"   Config: {best_config_used['name'] if best_config_used else 'N/A'}")
         elif matches_data:
             # Fallback to last successful matches_data
-            print(f"\n📊 Using last result: {len(matches_data)} matches")
+            logger.info(f"📊 Using last result: {len(matches_data)} matches")
         
         # Parse matches if found
         if matches_data:
+            league_set = frozenset(leagues or ())
             for match_data in matches_data:
                 # Filter by leagues if specified and if league info is available
                 match_league_id = match_data.get("league", {}).get("id") or match_data.get("leagueId") or match_data.get("league_id")
-                if leagues and match_league_id and match_league_id not in leagues:
+                if league_set and match_league_id and match_league_id not in league_set:
                     continue
                 
                 match = self._parse_broadage_fixture(match_data)
@@ -452,202 +1120,486 @@ class MatchFetcher:
                     all_matches.append(match)
         
         if api_errors:
-            print(f"\n⚠️ Broadage API Errors: {len(api_errors)} errors")
+            logger.warning(f"⚠️ Broadage API Errors: {len(api_errors)} errors")
             for err in api_errors[:5]:
-                print(f"  - {err}")
+                logger.warning(f"  - {err}")
         
-        print(f"📊 Total matches fetched from Broadage: {len(all_matches)}")
+        logger.info(f"📊 Total matches fetched from Broadage: {len(all_matches)}")
         return all_matches
     
+    def _broadage_source(self) -> Optional[Tuple[str, str]]:
+        """(endpoint, auth config name) that last returned matches, from memory or the fixture cache"""
+        if self._broadage_endpoint is None and self._fixture_cache is not None:
+            source = self._fixture_cache.get(BROADAGE_SOURCE_KEY)
+            if source:
+                self._broadage_endpoint = tuple(source)
+        return self._broadage_endpoint
+    
+    def _remember_broadage_source(self, endpoint: str, config_name: str) -> None:
+        self._broadage_endpoint = (endpoint, config_name)
+        if self._fixture_cache is not None:
+            self._fixture_cache.set(BROADAGE_SOURCE_KEY, [endpoint, config_name], expire=BROADAGE_SOURCE_TTL)
+    
     def _fetch_from_api_football(self, today: str, season_year: int, leagues: List[int]) -> List[Dict]:
         """Fetch matches from API-Football"""
-        all_matches = []
         api_errors = []
         
-        for league_id in leagues:
-            try:
-                url = f"{self.base_url}/fixtures"
-                params = {
-                    "date": today,
-                    "league": league_id,
-                    "season": season_year
-                }
-                
-                print(f"  📡 Fetching league {league_id} (date: {today})...")
-                response = requests.get(url, headers=self.headers, params=params, timeout=15)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Check API response structure
-                    if "errors" in data and data["errors"]:
-                        error_msgs = data.get("errors", {})
-                        error_text = str(error_msgs)
-                        print(f"  🔍 Full error response: {error_msgs}")
-                        
-                        # If error mentions free plan limitation, check what we can do
-                        if isinstance(error_msgs, dict) and 'plan' in str(error_msgs):
-                            error_text = str(error_msgs.get('plan', ''))
-                            if 'Free plans' in error_text and '2021 to 2023' in error_text:
-                                print(f"  ⚠️ League {league_id}: Free plan limitation detected")
-                                print(f"     Trying with season 2024 (current season)...")
-                                # Retry with 2024 season (current season)
-                                params_2024 = {
-                                    "date": today,
-                                    "league": league_id,
-                                    "season": 2024
-                                }
-                                try:
-                                    response_2024 = requests.get(url, headers=self.headers, params=params_2024, timeout=15)
-                                    if response_2024.status_code == 200:
-                                        data_2024 = response_2024.json()
-                                        if not (data_2024.get("errors") and data_2024["errors"]):
-                                            data = data_2024
-                                            print(f"  ✅ League {league_id}: Successfully fetched with season 2024!")
-                                        else:
-                                            api_errors.append(f"League {league_id}: Free plan - no access to current season")
-                                            print(f"  ❌ League {league_id}: Free plan cannot access current season data")
-                                            continue
-                                    else:
-                                        api_errors.append(f"League {league_id}: HTTP {response_2024.status_code}")
-                                        continue
-                                except:
-                                    pass
-                        
-                        if "errors" in data and data["errors"]:
-                            api_errors.append(f"League {league_id}: API errors - {error_msgs}")
-                            print(f"  ⚠️ League {league_id}: API returned errors: {error_msgs}")
-                            continue
-                    
-                    # Check if API rate limit info
-                    api_rate_limit = data.get("results", 0)
-                    if isinstance(data.get("response"), list):
-                        fixtures = data.get("response", [])
-                    else:
-                        fixtures = []
-                    
-                    print(f"  ✅ League {league_id}: Found {len(fixtures)} fixtures (API results: {api_rate_limit})")
-                    
-                    for fixture in fixtures:
-                        match = self._parse_fixture(fixture)
-                        if match:
-                            all_matches.append(match)
-                        else:
-                            print(f"    ⚠️ Failed to parse fixture: {fixture.get('fixture', {}).get('id')}")
-                elif response.status_code == 403:
-                    error_msg = f"League {league_id}: 403 Forbidden - API key might be invalid or expired"
-                    api_errors.append(error_msg)
-                    print(f"  ❌ {error_msg}")
-                    print(f"    Response: {response.text[:200]}")
-                elif response.status_code == 429:
-                    error_msg = f"League {league_id}: 429 Too Many Requests - Rate limited"
-                    api_errors.append(error_msg)
-                    print(f"  ⚠️ {error_msg}")
-                else:
-                    error_msg = f"League {league_id}: HTTP {response.status_code}"
-                    api_errors.append(f"{error_msg} - {response.text[:100]}")
-                    print(f"  ⚠️ {error_msg} - {response.text[:200]}")
-                
-            except requests.exceptions.Timeout:
-                error_msg = f"League {league_id}: Request timeout"
-                api_errors.append(error_msg)
-                print(f"  ❌ {error_msg}")
-            except Exception as e:
-                import traceback
-                error_msg = f"League {league_id}: {str(e)}"
+        # One date-only request covers every league; per-league requests are the fallback
+        all_matches = self._fetch_bulk(today, leagues)
+        if all_matches is None:
+            # League requests are independent, so issue them concurrently and merge in league order
+            all_matches, api_errors = self._merge_league_results(
+                leagues, self._fetch_leagues(today, season_year, leagues))
+        self._report_fixture_errors(today, all_matches, api_errors)
+        
+        # Enrich with real odds from OddsAPI (once per day)
+        if all_matches and self._odds_fetched_for != today:
+            self._reset_odds(today)
+            self._fetch_odds_for_matches(all_matches)
+        
+        self._merge_odds(all_matches)
+        return all_matches
+    
+    async def _fetch_from_api_football_async(self, today: str, season_year: int, leagues: List[int]) -> List[Dict]:
+        """Async variant of _fetch_from_api_football over the shared httpx client"""
+        client = self._get_async_client()
+        api_errors = []
+        
+        all_matches = await self._fetch_bulk_async(client, today, leagues)
+        if all_matches is None:
+            all_matches, api_errors = self._merge_league_results(
+                leagues, await self._fetch_leagues_async(today, season_year, leagues, client))
+        self._report_fixture_errors(today, all_matches, api_errors)
+        
+        if all_matches and self._odds_fetched_for != today:
+            self._reset_odds(today)
+            await asyncio.to_thread(self._fetch_odds_for_matches, all_matches)
+        
+        self._merge_odds(all_matches)
+        return all_matches
+    
+    @staticmethod
+    def _merge_league_results(leagues: List[int], results: List) -> Tuple[List[Dict], List[str]]:
+        """Merge per-league (matches, errors) results, or their exceptions, in league order"""
+        all_matches = []
+        api_errors = []
+        for league_id, result in zip(leagues, results):
+            if isinstance(result, BaseException):
+                error_msg = f"League {league_id}: {str(result)}"
                 api_errors.append(error_msg)
-                print(f"  ❌ Error fetching league {league_id}: {e}")
-                print(f"    Traceback: {traceback.format_exc()}")
+                logger.error("  ❌ Error fetching league %s: %s", league_id, result)
+                # The worker's traceback travels with the exception; only format it at DEBUG
+                logger.debug("League %s request failed", league_id, exc_info=result)
                 continue
-        
+            league_matches, league_errors = result
+            all_matches.extend(league_matches)
+            api_errors.extend(league_errors)
+        return all_matches, api_errors
+    
+    @staticmethod
+    def _report_fixture_errors(today: str, all_matches: List[Dict], api_errors: List[str]):
+        """Print a summary of fixture errors, or why no matches were found"""
         if api_errors:
-            print(f"\n⚠️ API Errors encountered: {len(api_errors)} errors")
+            logger.warning("⚠️ API Errors encountered: %s errors", len(api_errors))
             for err in api_errors[:5]:  # Show first 5 errors
-                print(f"  - {err}")
+                logger.warning("  - %s", err)
         
-        print(f"📊 Total matches fetched: {len(all_matches)}")
+        logger.info("📊 Total matches fetched: %s", len(all_matches))
         if len(all_matches) == 0 and api_errors:
-            print(f"⚠️ No matches found. Check API errors above. Possible issues:")
-            print(f"   - API rate limit exceeded")
-            print(f"   - Invalid API key")
-            print(f"   - No matches scheduled for {today}")
-            print(f"   - Wrong date format or timezone")
+            logger.warning("⚠️ No matches found. Check API errors above. Possible issues:")
+            logger.warning("   - API rate limit exceeded")
+            logger.warning("   - Invalid API key")
+            logger.warning("   - No matches scheduled for %s", today)
+            logger.warning("   - Wrong date format or timezone")
         
         # If no matches found, log the issue
         if not all_matches:
-            print("⚠️ No matches found from API-Football!")
-            print("   Possible reasons:")
-            print("   1. API_FOOTBALL_KEY not set or invalid")
-            print("   2. No matches scheduled today")
-            print("   3. API rate limit exceeded")
-            print("   4. League IDs not valid")
+            logger.warning("⚠️ No matches found from API-Football!")
+            logger.warning("   Possible reasons:")
+            logger.warning("   1. API_FOOTBALL_KEY not set or invalid")
+            logger.warning("   2. No matches scheduled today")
+            logger.warning("   3. API rate limit exceeded")
+            logger.warning("   4. League IDs not valid")
             # Don't return sample matches - return empty so it's clear there's an issue
-        
-        # Enrich with real odds from OddsAPI
-        if all_matches and not self._odds_fetched:
-            self._fetch_odds_for_matches(all_matches)
-            self._odds_fetched = True
-        
-        # Merge odds into matches
+    
+    def _reset_odds(self, today: str) -> None:
+        """Start today's odds cache, dropping the previous day's odds"""
+        self._odds_cache = {}
+        self._odds_league_cache = {key: value for key, value in self._odds_league_cache.items() if key[1] == today}
+        self._odds_fetched_for = today
+    
+    def _merge_odds(self, all_matches: List[Dict]):
+        """Merge cached OddsAPI odds into matches"""
+        odds_cache = self._odds_cache
         for match in all_matches:
-            home_team = match.get('home_team', '')
-            away_team = match.get('away_team', '')
-            league_tier = match.get('league_tier', '')
-            
             # Get cached odds for this match
-            match_key = f"{home_team}_{away_team}"
-            odds = self._odds_cache.get(match_key, {})
+            odds = odds_cache.get(_odds_key(match.get('home_team', ''), match.get('away_team', '')), _EMPTY_ODDS)
             
             # Update match with real odds (prefer OddsAPI, fallback to API-Football)
-            if odds.get('home_odds'):
-                match['home_odds'] = odds['home_odds']
-            if odds.get('draw_odds'):
-                match['draw_odds'] = odds['draw_odds']
-            if odds.get('away_odds'):
-                match['away_odds'] = odds['away_odds']
+            # and add market-specific odds
+            if odds:
+                for key in _MATCH_ODDS_KEYS:
+                    if odds.get(key):
+                        match[key] = odds[key]
+                match['market_odds'] = {key: odds.get(key) for key in _MARKET_KEYS}
+            else:
+                match['market_odds'] = _EMPTY_MARKET_ODDS
+    
+    def _fetch_bulk(self, today: str, leagues: List[int]) -> Optional[List[Dict]]:
+        """
+        Fetch all of today's fixtures in one request and keep the requested leagues
+        
+        Returns None if the request fails or the API rejects it (e.g. plan limits),
+        so the caller can fall back to per-league requests.
+        """
+        try:
+            logger.info("  📡 Fetching all fixtures (date: %s)...", today)
+            response = self._get_fixtures({"date": today}, leagues=frozenset(leagues))
+        except Exception as e:
+            logger.warning("  ⚠️ Bulk fixtures request failed (%s), falling back to per-league requests", e)
+            return None
+        return self._bulk_matches(leagues, response)
+    
+    async def _fetch_bulk_async(self, client, today: str, leagues: List[int]) -> Optional[List[Dict]]:
+        """Async variant of _fetch_bulk"""
+        try:
+            logger.info("  📡 Fetching all fixtures (date: %s)...", today)
+            response = await self._get_fixtures_async(client, {"date": today}, leagues=frozenset(leagues))
+        except Exception as e:
+            logger.warning("  ⚠️ Bulk fixtures request failed (%s), falling back to per-league requests", e)
+            return None
+        return self._bulk_matches(leagues, response)
+    
+    def _bulk_matches(self, leagues: List[int], response: Tuple[int, Optional[Dict], str]) -> Optional[List[Dict]]:
+        """Parse the requested leagues' fixtures out of a bulk response, or None if it's unusable"""
+        status, data, text = response
+        if status != 200 or not isinstance(data, dict) or data.get("errors") or not isinstance(data.get("response"), list):
+            errors = data.get("errors") if isinstance(data, dict) else text[:200]
+            logger.warning("  ⚠️ Bulk fixtures request unusable (HTTP %s: %s), falling back to per-league requests", status, errors)
+            return None
+        
+        # Keep the per-league path's ordering: leagues in the order requested
+        league_order = {league_id: i for i, league_id in enumerate(leagues)}
+        fixtures = [f for f in data["response"] if f.get("league", {}).get("id") in league_order]
+        fixtures.sort(key=lambda f: league_order[f["league"]["id"]])
+        logger.info("  ✅ Found %s fixtures in requested leagues (API results: %s)", len(fixtures), data.get('results', 0))
+        
+        return self._parse_fixtures(fixtures)
+    
+    def _fetch_leagues(self, today: str, season_year: int, leagues: List[int]) -> List:
+        """
+        Fetch every league concurrently, returning one result per league in input order
+        
+        Each result is a (matches, errors) tuple or the exception raised for that league.
+        Uses httpx when available and no event loop is running in this thread (FastAPI
+        endpoints call us from inside one); otherwise falls back to a thread pool.
+        """
+        if not leagues:
+            return []
+        
+        if HTTPX_AVAILABLE:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._fetch_leagues_async(today, season_year, leagues))
+        
+        return list(self._get_executor().map(self._fetch_one_league, leagues,
+                                             [today] * len(leagues), [season_year] * len(leagues)))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Worker threads shared by per-league fixture and odds requests"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=FIXTURE_MAX_WORKERS, thread_name_prefix="fixtures")
+        return self._executor
+    
+    def _fetch_one_league(self, league_id: int, today: str, season: int):
+        """Thread-pool task: one league's (matches, errors), or the exception it raised"""
+        try:
+            return self._fetch_league_sync(league_id, today, season)
+        except Exception as e:
+            return e
+    
+    def _new_async_client(self):
+        """httpx client for concurrent fixture requests; HTTP/2 when h2 is installed"""
+        return httpx.AsyncClient(
+            headers=self.headers,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=FIXTURE_CONNECTIONS_PER_HOST,
+                                max_keepalive_connections=FIXTURE_KEEPALIVE_CONNECTIONS),
+            timeout=FIXTURE_TIMEOUT
+        )
+    
+    def _get_async_client(self):
+        """Get or create the long-lived async client used by aget_today_matches"""
+        if self._async_client is None:
+            self._async_client = self._new_async_client()
+        return self._async_client
+    
+    async def _fetch_leagues_async(self, today: str, season_year: int, leagues: List[int], client=None) -> List:
+        """Fetch all leagues over one httpx client with asyncio.gather (a temporary one if not given)"""
+        if client is None:
+            async with self._new_async_client() as client:
+                return await self._fetch_leagues_async(today, season_year, leagues, client)
+        tasks = [self._fetch_league(client, league_id, today, season_year) for league_id in leagues]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _fetch_league(self, client, league_id: int, today: str, season: int) -> Tuple[List[Dict], List[str]]:
+        """Fetch and parse one league's fixtures over an httpx client"""
+        try:
+            logger.debug("  📡 Fetching league %s (date: %s)...", league_id, today)
+            first = await self._get_fixtures_async(client, self._league_params(league_id, today, season))
+            retry = None
+            if self._is_free_plan_error(league_id, first):
+                try:
+                    retry = await self._get_fixtures_async(client, self._league_params(league_id, today, 2024))
+                except Exception:
+                    pass
+            return self._league_result(league_id, first, retry)
+        except httpx.TimeoutException:
+            error_msg = f"League {league_id}: Request timeout"
+            logger.error("  ❌ %s", error_msg)
+            return [], [error_msg]
+    
+    async def _get_fixtures_async(self, client, params: Dict, leagues=None) -> Tuple[int, Optional[Dict], str]:
+        """GET /fixtures, backing off exponentially on 429/5xx before giving up"""
+        key = self._fixture_cache_key(params, leagues)
+        data, validators = self._cached_fixtures(key)
+        if data is not None:
+            return 200, data, ""
+        
+        url = f"{self.base_url}/fixtures"
+        for attempt in range(FIXTURE_RETRY_ATTEMPTS):
+            response = await client.get(url, params=params, headers=validators)
+            if response.status_code in FIXTURE_RETRY_STATUSES and attempt < FIXTURE_RETRY_ATTEMPTS - 1:
+                await asyncio.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+                continue
+            if response.status_code == 304:
+                data = self._revalidate_fixtures(key)
+                if data is not None:
+                    return 200, data, ""
+            data = _loads_fixtures(response.content, leagues) if response.status_code == 200 else None
+            if data is not None:
+                self._store_fixtures(key, params["date"], data, response.headers)
+            return response.status_code, data, response.text
+    
+    def _fetch_league_sync(self, league_id: int, today: str, season: int) -> Tuple[List[Dict], List[str]]:
+        """Fetch and parse one league's fixtures with requests"""
+        try:
+            logger.debug("  📡 Fetching league %s (date: %s)...", league_id, today)
+            first = self._get_fixtures(self._league_params(league_id, today, season))
+            retry = None
+            if self._is_free_plan_error(league_id, first):
+                try:
+                    retry = self._get_fixtures(self._league_params(league_id, today, 2024))
+                except Exception:
+                    pass
+            return self._league_result(league_id, first, retry)
+        except requests.exceptions.Timeout:
+            error_msg = f"League {league_id}: Request timeout"
+            logger.error("  ❌ %s", error_msg)
+            return [], [error_msg]
+    
+    def _get_fixtures(self, params: Dict, leagues=None) -> Tuple[int, Optional[Dict], str]:
+        """
+        GET /fixtures synchronously
+        
+        `leagues` (a set of league IDs) lets the decoder drop other leagues' fixtures early.
+        """
+        key = self._fixture_cache_key(params, leagues)
+        data, validators = self._cached_fixtures(key)
+        if data is not None:
+            return 200, data, ""
+        
+        response = self.session.get(f"{self.base_url}/fixtures", headers=validators,
+                                    params=params, timeout=FIXTURE_TIMEOUT)
+        if response.status_code == 304:
+            data = self._revalidate_fixtures(key)
+            if data is not None:
+                return 200, data, ""
+        data = _loads_fixtures(response.content, leagues) if response.status_code == 200 else None
+        if data is not None:
+            self._store_fixtures(key, params["date"], data, response.headers)
+        return response.status_code, data, response.text
+    
+    @staticmethod
+    def _fixture_cache_key(params: Dict, leagues=None) -> str:
+        key = f"{params['date']}:{params.get('league', 'all')}:{params.get('season', '')}"
+        if leagues is not None:
+            # Filtered responses differ per league set
+            key += ":" + ",".join(map(str, sorted(leagues)))
+        return key
+    
+    def _cached_fixtures(self, key: str) -> Tuple[Optional[Dict], Dict]:
+        """
+        Look up a cached /fixtures response
+        
+        Returns (data, {}) for a fresh entry, otherwise (None, validators) where validators
+        are the If-None-Match/If-Modified-Since headers for revalidating a stale entry.
+        """
+        if self._fixture_cache is None:
+            return None, {}
+        entry = self._fixture_cache.get(key)
+        if entry is None:
+            return None, {}
+        if time.time() - entry["fetched_at"] < entry["ttl"]:
+            return entry["data"], {}
+        validators = {}
+        if entry.get("etag"):
+            validators["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            validators["If-Modified-Since"] = entry["last_modified"]
+        return None, validators
+    
+    def _store_fixtures(self, key: str, date: str, data: Dict, headers) -> None:
+        if self._fixture_cache is None:
+            return
+        if date < datetime.now().strftime("%Y-%m-%d"):
+            ttl = FIXTURE_CACHE_TTL_PAST
+        elif self._has_live_fixtures(data):
+            ttl = FIXTURE_CACHE_TTL
+        else:
+            ttl = FIXTURE_CACHE_TTL_QUIET
+        entry = {
+            "data": data,
+            "fetched_at": time.time(),
+            "ttl": ttl,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        self._fixture_cache.set(key, entry, expire=FIXTURE_CACHE_RETENTION)
+    
+    @staticmethod
+    def _has_live_fixtures(data: Dict) -> bool:
+        """True if any fixture kicks off (or kicked off) within FIXTURE_LIVE_WINDOW of now"""
+        now = time.time()
+        for fixture in data.get("response") or ():
+            try:
+                kick_off = _parse_iso(fixture["fixture"]["date"]).timestamp()
+            except (KeyError, TypeError, ValueError):
+                return True  # Can't tell - keep the short TTL
+            if abs(kick_off - now) <= FIXTURE_LIVE_WINDOW:
+                return True
+        return False
+    
+    def _revalidate_fixtures(self, key: str) -> Optional[Dict]:
+        """Server answered 304: the stale entry is current again, so restart its TTL"""
+        if self._fixture_cache is None:
+            return None
+        entry = self._fixture_cache.get(key)
+        if entry is None:
+            return None
+        entry["fetched_at"] = time.time()
+        self._fixture_cache.set(key, entry, expire=FIXTURE_CACHE_RETENTION)
+        return entry["data"]
+    
+    @staticmethod
+    def _league_params(league_id: int, today: str, season: int) -> Dict:
+        return {
+            "date": today,
+            "league": league_id,
+            "season": season
+        }
+    
+    @staticmethod
+    def _is_free_plan_error(league_id: int, response: Tuple[int, Optional[Dict], str]) -> bool:
+        """True when the API rejected the season because of the free plan's 2021-2023 limit"""
+        status, data, _ = response
+        if status != 200 or not data.get("errors"):
+            return False
+        error_msgs = data["errors"]
+        if isinstance(error_msgs, dict) and 'plan' in str(error_msgs):
+            error_text = str(error_msgs.get('plan', ''))
+            if 'Free plans' in error_text and '2021 to 2023' in error_text:
+                logger.warning("  ⚠️ League %s: Free plan limitation detected", league_id)
+                logger.info("     Trying with season 2024 (current season)...")
+                return True
+        return False
+    
+    def _league_result(self, league_id: int, response: Tuple[int, Optional[Dict], str],
+                       retry: Optional[Tuple[int, Optional[Dict], str]] = None) -> Tuple[List[Dict], List[str]]:
+        """
+        Turn a /fixtures response into (matches, errors) for one league
+        
+        `retry` is the season-2024 response when the first one hit the free plan limit.
+        """
+        status, data, text = response
+        
+        if status == 403:
+            error_msg = f"League {league_id}: 403 Forbidden - API key might be invalid or expired"
+            logger.error("  ❌ %s", error_msg)
+            logger.debug("    Response: %s", text[:200])
+            return [], [error_msg]
+        if status == 429:
+            error_msg = f"League {league_id}: 429 Too Many Requests - Rate limited"
+            logger.warning("  ⚠️ %s", error_msg)
+            return [], [error_msg]
+        if status != 200:
+            error_msg = f"League {league_id}: HTTP {status}"
+            logger.warning("  ⚠️ %s - %s", error_msg, text[:200])
+            return [], [f"{error_msg} - {text[:100]}"]
+        
+        # Check API response structure
+        if "errors" in data and data["errors"]:
+            error_msgs = data.get("errors", {})
+            logger.debug("  🔍 Full error response: %s", error_msgs)
             
-            # Add market-specific odds
-            match['market_odds'] = {
-                'over_0.5_goals': odds.get('over_0.5_goals'),
-                'over_1.5_goals': odds.get('over_1.5_goals'),
-                'home_over_0.5': odds.get('home_over_0.5'),
-                'away_over_0.5': odds.get('away_over_0.5'),
-            }
+            if retry is not None:
+                retry_status, retry_data, _ = retry
+                if retry_status != 200:
+                    return [], [f"League {league_id}: HTTP {retry_status}"]
+                if retry_data.get("errors") and retry_data["errors"]:
+                    logger.error("  ❌ League %s: Free plan cannot access current season data", league_id)
+                    return [], [f"League {league_id}: Free plan - no access to current season"]
+                data = retry_data
+                logger.info("  ✅ League %s: Successfully fetched with season 2024!", league_id)
+            
+            if "errors" in data and data["errors"]:
+                logger.warning("  ⚠️ League %s: API returned errors: %s", league_id, error_msgs)
+                return [], [f"League {league_id}: API errors - {error_msgs}"]
         
-        return all_matches
+        # Check if API rate limit info
+        api_rate_limit = data.get("results", 0)
+        if isinstance(data.get("response"), list):
+            fixtures = data.get("response", [])
+        else:
+            fixtures = []
+        
+        logger.info("  ✅ League %s: Found %s fixtures (API results: %s)", league_id, len(fixtures), api_rate_limit)
+        
+        return self._parse_fixtures(fixtures), []
     
     def _fetch_odds_for_matches(self, matches: List[Dict]):
         """Fetch odds from OddsAPI for all matches"""
         if not self.odds_client:
-            print("⚠️ OddsAPI client not available. Using API-Football odds only.")
+            logger.info("⚠️ OddsAPI client not available. Using API-Football odds only.")
             return
         if not self.odds_client.api_key:
-            print("⚠️ OddsAPI key not set. Using API-Football odds only.")
+            logger.warning("⚠️ OddsAPI key not set. Using API-Football odds only.")
             return
         
         # Group matches by league tier
-        matches_by_league = {}
+        matches_by_league: Dict[str, List[Dict]] = defaultdict(list)
         for match in matches:
-            league_tier = match.get('league_tier', '')
-            if league_tier not in matches_by_league:
-                matches_by_league[league_tier] = []
-            matches_by_league[league_tier].append(match)
+            matches_by_league[match.get('league_tier', '')].append(match)
         
-        # Fetch odds for each league
-        for league_tier, league_matches in matches_by_league.items():
+        # Fetch odds for every league concurrently, then match them up in league order
+        today = datetime.now().strftime("%Y-%m-%d")
+        tiers = list(matches_by_league)
+        results = self._get_executor().map(self._fetch_league_odds, tiers, [today] * len(tiers))
+        for league_tier, odds_data in zip(tiers, results):
+            if isinstance(odds_data, Exception):
+                logger.warning("⚠️ Error fetching odds for %s: %s", league_tier, odds_data)
+                continue
+            if not odds_data:
+                logger.warning("⚠️ No odds data from OddsAPI for %s", league_tier)
+                continue
+            
             try:
-                print(f"📊 Fetching odds from OddsAPI for {league_tier}...")
-                odds_data = self.odds_client.get_odds_for_league(league_tier)
-                
-                if not odds_data:
-                    print(f"⚠️ No odds data from OddsAPI for {league_tier}")
-                    continue
-                
                 # Extract odds for each match
-                for match in league_matches:
+                for match in matches_by_league[league_tier]:
                     home_team = match.get('home_team', '')
                     away_team = match.get('away_team', '')
-                    match_key = f"{home_team}_{away_team}"
+                    match_key = _odds_key(home_team, away_team)
                     
                     odds = self.odds_client.extract_odds_for_match(
                         odds_data, home_team, away_team
@@ -655,145 +1607,155 @@ class MatchFetcher:
                     
                     if odds.get('home_odds') or odds.get('over_0.5_goals'):
                         self._odds_cache[match_key] = odds
-                        print(f"✅ Found odds for {home_team} vs {away_team}")
+                        logger.debug("✅ Found odds for %s vs %s", home_team, away_team)
                 
             except Exception as e:
-                print(f"⚠️ Error fetching odds for {league_tier}: {e}")
+                logger.warning("⚠️ Error fetching odds for %s: %s", league_tier, e)
                 continue
     
-    def _parse_fixture(self, fixture: Dict) -> Optional[Dict]:
-        """Parse API-Football fixture to internal format"""
+    def _fetch_league_odds(self, league_tier: str, today: str):
+        """Thread-pool task: one league's OddsAPI odds (cached for ODDS_CACHE_TTL), or the exception raised"""
+        key = (league_tier, today)
+        cached = self._odds_league_cache.get(key)
+        if cached is not None and time.time() - cached[0] < ODDS_CACHE_TTL:
+            return cached[1]
+        try:
+            logger.debug("📊 Fetching odds from OddsAPI for %s...", league_tier)
+            odds_data = self.odds_client.get_odds_for_league(league_tier)
+        except Exception as e:
+            return e
+        if odds_data:
+            self._odds_league_cache[key] = (time.time(), odds_data)
+        return odds_data
+    
+    def _parse_fixtures(self, fixtures: List[Dict]) -> List[Dict]:
+        """Parse a list of API-Football fixtures, skipping (and logging) malformed ones"""
+        # Sized up front (one slot per fixture), then trimmed to the ones that parsed
+        matches = [None] * len(fixtures)
+        count = 0
+        now = datetime.now()  # Kick-off fallback shared by the whole batch
+        for fixture in fixtures:
+            match = self._parse_fixture(fixture, now)
+            if match:
+                matches[count] = match
+                count += 1
+            else:
+                logger.warning("Failed to parse fixture: %s", fixture.get('fixture', {}).get('id'))
+        del matches[count:]
+        return matches
+    
+    def _parse_fixture(self, fixture: Dict, now: Optional[datetime] = None) -> Optional[Dict]:
+        """Parse API-Football fixture to internal format (`now` stands in for a missing kick-off)"""
+        # Entries without an id or team names are useless downstream - reject them
+        # up front instead of going through the exception path below
+        get = fixture.get
+        fixture_data = get("fixture")
+        teams = get("teams")
+        if not isinstance(fixture_data, dict) or fixture_data.get("id") is None or not isinstance(teams, dict):
+            return None
+        home = teams.get("home")
+        away = teams.get("away")
+        if not (isinstance(home, dict) and home.get("name") and isinstance(away, dict) and away.get("name")):
+            return None
+        
+        # Only the remaining dict walk and the float/date conversions can fail on a malformed fixture
         try:
-            teams = fixture.get("teams", {})
-            home = teams.get("home", {})
-            away = teams.get("away", {})
-            league = fixture.get("league", {})
-            fixture_data = fixture.get("fixture", {})
+            league = get("league", {})
             
-            # Get odds if available
-            odds_data = fixture.get("odds", [])
-            bookmaker_odds = {}
+            # Get odds if available (defaults for any outcome the bookmaker doesn't price)
+            odds_data = get("odds")
+            bookmaker_odds = DEFAULT_ODDS.copy()
             
             if odds_data:
-                for bookmaker in odds_data:
-                    if bookmaker.get("bookmaker", {}).get("name") == "Bet365":
-                        outcomes = bookmaker.get("bets", [])
-                        for outcome in outcomes:
-                            if outcome.get("name") == "Match Winner":
-                                values = outcome.get("values", [])
-                                for val in values:
-                                    if val.get("value") == "Home":
-                                        bookmaker_odds['home'] = float(val.get("odd", 2.0))
-                                    elif val.get("value") == "Draw":
-                                        bookmaker_odds['draw'] = float(val.get("odd", 3.0))
-                                    elif val.get("value") == "Away":
-                                        bookmaker_odds['away'] = float(val.get("odd", 2.5))
+                by_name = {b.get("bookmaker", {}).get("name", ""): b for b in odds_data}
+                bookmaker = next((by_name[name] for name in PREFERRED_BOOKMAKERS if name in by_name), None)
+                if bookmaker:
+                    bets = {bet.get("name"): bet for bet in bookmaker.get("bets", ())}
+                    match_winner = bets.get("Match Winner")
+                    if match_winner:
+                        val2key = VAL2KEY
+                        for val in match_winner.get("values", ()):
+                            key = val2key.get(val.get("value"))
+                            if key:
+                                bookmaker_odds[key] = float(val.get("odd", bookmaker_odds[key]))
             
-            match = {
-                'id': str(fixture_data.get("id")),
-                'home_team': home.get("name", ""),
-                'away_team': away.get("name", ""),
-                'league': league.get("name", ""),
-                'league_tier': self._map_league_tier(league.get("id")),
-                'match_date': datetime.fromisoformat(fixture_data.get("date", "")),
-                'home_odds': bookmaker_odds.get('home', 2.0),
-                'draw_odds': bookmaker_odds.get('draw', 3.0),
-                'away_odds': bookmaker_odds.get('away', 2.5),
-                
-                # Default stats (in production, fetch detailed stats)
-                'home_form': {
-                    'goals_scored_5': 12,
-                    'goals_conceded_5': 3,
-                    'form_percentage': 0.85,
-                    'shots_on_target_avg': 6.0,
-                    'goals_variance': 5.0  # Low variance = predictable
-                },
-                'away_form': {
-                    'goals_scored_5': 4,
-                    'goals_conceded_5': 8,
-                    'form_percentage': 0.3,
-                    'shots_on_target_avg': 3.0,
-                    'goals_variance': 6.0  # Low variance
-                },
-                'home_xg': 2.1,
-                'away_xg': 0.8,
-                'home_position': 3,
-                'away_position': 20,
-                'league_size': 20,
-                'table_gap': 17,
-                'pressure_index': 0.4,  # Low pressure
-                'is_derby': False,
-                'is_must_win': False,
-                'key_player_missing': False,
-                'fixture_congestion': 7,
-                'home_fixture_congestion': 7,
-                'away_fixture_congestion': 7
-            }
-            
-            return match
-            
-        except Exception as e:
-            print(f"Error parsing fixture: {e}")
+            date_str = fixture_data.get("date")
+            match_date = _parse_iso(date_str) if date_str else (now or datetime.now())
+            league_id = league.get("id")
+            league_tier = _LEAGUE_TIER.get(league_id) or f"league_{league_id}"
+            home_team = home.get("name", "")
+            away_team = away.get("name", "")
+            league_name = league.get("name", "")
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.exception("Error parsing fixture: %s", e)
             return None
+        
+        match = _DEFAULT_MATCH.copy()
+        match['id'] = str(fixture_data.get("id"))
+        match['home_team'] = home_team
+        match['away_team'] = away_team
+        match['league'] = league_name
+        match['league_tier'] = league_tier
+        match['match_date'] = match_date
+        match['home_odds'] = bookmaker_odds['home']
+        match['draw_odds'] = bookmaker_odds['draw']
+        match['away_odds'] = bookmaker_odds['away']
+        
+        return match
     
     def _parse_broadage_fixture(self, fixture_data: Dict) -> Optional[Dict]:
         """Parse Broadage API fixture to internal format"""
         try:
             # Broadage API response format - teams come as dicts with 'name' field
             # Extract team names properly
-            home_team_obj = fixture_data.get("homeTeam") or fixture_data.get("home_team") or fixture_data.get("home")
-            away_team_obj = fixture_data.get("awayTeam") or fixture_data.get("away_team") or fixture_data.get("away")
+            home_team_obj = _first(fixture_data, _BROADAGE_HOME_KEYS)
+            away_team_obj = _first(fixture_data, _BROADAGE_AWAY_KEYS)
             
             # Extract name if it's a dict, otherwise use as string
             if isinstance(home_team_obj, dict):
-                home_team = home_team_obj.get("name", "") or home_team_obj.get("shortName", "") or home_team_obj.get("mediumName", "")
+                home_team = _first(home_team_obj, _BROADAGE_TEAM_NAME_KEYS, "")
             else:
                 home_team = str(home_team_obj) if home_team_obj else ""
             
             if isinstance(away_team_obj, dict):
-                away_team = away_team_obj.get("name", "") or away_team_obj.get("shortName", "") or away_team_obj.get("mediumName", "")
+                away_team = _first(away_team_obj, _BROADAGE_TEAM_NAME_KEYS, "")
             else:
                 away_team = str(away_team_obj) if away_team_obj else ""
             
             # Ensure we have team names
             if not home_team or not away_team:
-                print(f"⚠️ Missing team names in fixture: home={home_team_obj}, away={away_team_obj}")
+                logger.warning("Missing team names in fixture: home=%s, away=%s", home_team_obj, away_team_obj)
                 return None
             
             # Extract league info - could be dict or string
-            league_info = fixture_data.get("league") or fixture_data.get("tournament")
+            league_info = _first(fixture_data, _BROADAGE_LEAGUE_KEYS)
             if isinstance(league_info, dict):
-                league_name = league_info.get("name", "") or league_info.get("shortName", "")
+                league_name = _first(league_info, _BROADAGE_LEAGUE_NAME_KEYS, "")
                 league_id = league_info.get("id")
             else:
                 league_name = str(league_info) if league_info else ""
-                league_id = fixture_data.get("leagueId") or fixture_data.get("league_id") or fixture_data.get("tournamentId")
+                league_id = _first(fixture_data, _BROADAGE_LEAGUE_ID_KEYS)
             
             # Parse date - try multiple formats
-            date_str = (
-                fixture_data.get("date", "") or
-                fixture_data.get("startTime", "") or
-                fixture_data.get("matchDate", "") or
-                fixture_data.get("kickoff", "")
-            )
+            date_str = _first(fixture_data, _BROADAGE_DATE_KEYS, "")
             
             try:
                 if date_str:
                     # Try multiple date formats
                     if 'T' in str(date_str) or 'Z' in str(date_str):
                         # ISO format: "2025-11-28T19:00:00Z" or "2025-11-28T19:00:00+00:00"
-                        match_date = datetime.fromisoformat(str(date_str).replace('Z', '+00:00'))
+                        match_date = _parse_iso(str(date_str))
                     elif '/' in str(date_str):
                         # DD/MM/YYYY format: "28/11/2025 19:00:00"
                         date_part = str(date_str).split()[0] if ' ' in str(date_str) else str(date_str)
                         match_date = datetime.strptime(date_part, "%d/%m/%Y")
                     else:
                         # Try standard format
-                        match_date = datetime.fromisoformat(str(date_str))
+                        match_date = _parse_iso(str(date_str))
                 else:
                     match_date = datetime.now()
             except Exception as date_error:
-                print(f"⚠️ Could not parse date '{date_str}': {date_error}, using current time")
+                logger.warning("Could not parse date '%s': %s, using current time", date_str, date_error)
                 match_date = datetime.now()
             
             # Get odds - try multiple formats
@@ -801,51 +1763,21 @@ class MatchFetcher:
             if not isinstance(odds_data, dict):
                 odds_data = {}
             
-            match = {
-                'id': str(fixture_data.get("id", fixture_data.get("matchId", ""))),
-                'home_team': home_team,
-                'away_team': away_team,
-                'league': league_name or "Unknown League",
-                'league_tier': self._map_league_tier(league_id) if league_id else "other",
-                'match_date': match_date,
-                'home_odds': float(odds_data.get("home", odds_data.get("1", 2.0))) if odds_data else 2.0,
-                'draw_odds': float(odds_data.get("draw", odds_data.get("X", 3.0))) if odds_data else 3.0,
-                'away_odds': float(odds_data.get("away", odds_data.get("2", 2.5))) if odds_data else 2.5,
-                
-                # Default stats - Broadage might provide more detailed stats
-                'home_form': {
-                    'goals_scored_5': 10,
-                    'goals_conceded_5': 4,
-                    'form_percentage': 0.7,
-                    'shots_on_target_avg': 5.0,
-                    'goals_variance': 5.0
-                },
-                'away_form': {
-                    'goals_scored_5': 8,
-                    'goals_conceded_5': 5,
-                    'form_percentage': 0.65,
-                    'shots_on_target_avg': 4.5,
-                    'goals_variance': 6.0
-                },
-                'home_xg': 1.8,
-                'away_xg': 1.5,
-                'home_position': 8,
-                'away_position': 12,
-                'league_size': 20,
-                'table_gap': 4,
-                'pressure_index': 0.5,
-                'is_derby': False,
-                'is_must_win': False,
-                'key_player_missing': False,
-                'fixture_congestion': 7,
-                'home_fixture_congestion': 7,
-                'away_fixture_congestion': 7
-            }
+            match = _DEFAULT_BROADAGE_MATCH.copy()
+            match['id'] = str(fixture_data.get("id", fixture_data.get("matchId", "")))
+            match['home_team'] = home_team
+            match['away_team'] = away_team
+            match['league'] = league_name or "Unknown League"
+            match['league_tier'] = self._map_league_tier(league_id) if league_id else "other"
+            match['match_date'] = match_date
+            match['home_odds'] = float(odds_data.get("home", odds_data.get("1", 2.0))) if odds_data else 2.0
+            match['draw_odds'] = float(odds_data.get("draw", odds_data.get("X", 3.0))) if odds_data else 3.0
+            match['away_odds'] = float(odds_data.get("away", odds_data.get("2", 2.5))) if odds_data else 2.5
             
             return match
             
         except Exception as e:
-            print(f"Error parsing Broadage fixture: {e}")
+            logger.exception("Error parsing Broadage fixture: %s", e)
             return None
     
     def _enrich_match_with_statistics(self, match: Dict) -> Dict:
@@ -864,30 +1796,10 @@ class MatchFetcher:
             return match
         
         try:
-            home_team = match.get('home_team', '')
-            away_team = match.get('away_team', '')
-            league_name = match.get('league', '')
-            league_id = match.get('league_id')  # May not be set
-            match_date = match.get('match_date', datetime.now())
-            
-            if not home_team or not away_team:
-                logger.warning(f"Missing team names, skipping enrichment: {home_team} vs {away_team}")
-                return match
-            
-            # Get competition code for Football-Data.org
-            competition_code = self.history_service.get_competition_code(
-                league_id=league_id,
-                league_name=league_name
-            )
-            
-            if not competition_code:
-                logger.warning(f"⚠️ Could not map league '{league_name}' (ID: {league_id}) to Football-Data.org code, using defaults")
-                logger.warning(f"   Available mappings: {list(self.history_service.LEAGUE_MAPPING.keys())}")
+            context = self._enrichment_context(match)
+            if context is None:
                 return match
-            
-            logger.info(f"✅ Mapped league '{league_name}' (ID: {league_id}) to competition code: {competition_code}")
-            
-            logger.info(f"Enriching {home_team} vs {away_team} ({competition_code})")
+            home_team, away_team, competition_code, match_date = context
             
             # Fetch real team form
             try:
@@ -904,10 +1816,6 @@ class MatchFetcher:
                     matches_needed=5
                 )
                 
-                # Calculate real xG from form
-                home_xg = self.history_service.calculate_xg_from_form(home_form, is_home=True)
-                away_xg = self.history_service.calculate_xg_from_form(away_form, is_home=False)
-                
                 # Fetch H2H history
                 h2h = self.history_service.calculate_h2h(
                     team1_name=home_team,
@@ -917,109 +1825,172 @@ class MatchFetcher:
                     matches_needed=5
                 )
                 
-                # Update match with real data
-                match['home_form'] = {
-                    'goals_scored_5': home_form.get('goals_scored_5', 0),
-                    'goals_conceded_5': home_form.get('goals_conceded_5', 0),
-                    'form_percentage': home_form.get('form_percentage', 0.5),
-                    'wins': home_form.get('wins', 0),
-                    'draws': home_form.get('draws', 0),
-                    'losses': home_form.get('losses', 0),
-                    'form_string': home_form.get('form_string', ''),
-                    'points_5': home_form.get('points_5', 0),
-                    'clean_sheets': home_form.get('clean_sheets', 0),
-                    'matches_count': home_form.get('matches_count', 0),
-                    'avg_goals_scored': home_form.get('avg_goals_scored', 0.0),
-                    'avg_goals_conceded': home_form.get('avg_goals_conceded', 0.0),
-                    'shots_on_target_avg': home_form.get('avg_goals_scored', 0.0) * 2.5,  # Estimate SOT from goals
-                    'goals_variance': abs(home_form.get('avg_goals_scored', 1.5) - 1.5) * 2  # Estimate variance
-                }
-                
-                match['away_form'] = {
-                    'goals_scored_5': away_form.get('goals_scored_5', 0),
-                    'goals_conceded_5': away_form.get('goals_conceded_5', 0),
-                    'form_percentage': away_form.get('form_percentage', 0.5),
-                    'wins': away_form.get('wins', 0),
-                    'draws': away_form.get('draws', 0),
-                    'losses': away_form.get('losses', 0),
-                    'form_string': away_form.get('form_string', ''),
-                    'points_5': away_form.get('points_5', 0),
-                    'clean_sheets': away_form.get('clean_sheets', 0),
-                    'matches_count': away_form.get('matches_count', 0),
-                    'avg_goals_scored': away_form.get('avg_goals_scored', 0.0),
-                    'avg_goals_conceded': away_form.get('avg_goals_conceded', 0.0),
-                    'shots_on_target_avg': away_form.get('avg_goals_scored', 0.0) * 2.5,
-                    'goals_variance': abs(away_form.get('avg_goals_scored', 1.5) - 1.5) * 2
-                }
-                
-                match['home_xg'] = round(home_xg, 2)
-                match['away_xg'] = round(away_xg, 2)
-                
-                # Add H2H data
-                match['h2h'] = {
-                    'home_wins': h2h.get('team1_wins', 0),
-                    'away_wins': h2h.get('team2_wins', 0),
-                    'draws': h2h.get('draws', 0),
-                    'total_matches': h2h.get('total_matches', 0),
-                    'avg_goals_home': h2h.get('avg_goals_team1', 0.0),
-                    'avg_goals_away': h2h.get('avg_goals_team2', 0.0),
-                    'recent_trend': h2h.get('recent_trend', 'unknown'),
-                    'avg_total_goals': h2h.get('avg_total_goals', 0.0)
-                }
-                
-                # Mark as enriched with real data
-                match['_stats_source'] = 'football_data_org'
-                match['_enrichment_status'] = 'success'
-                
-                logger.info(f"✅ Enriched {home_team} vs {away_team}: Form={home_form.get('form_string', 'N/A')}, H2H={h2h.get('total_matches', 0)} matches")
+                self._apply_statistics(match, home_form, away_form, h2h)
                 
             except Exception as form_error:
-                logger.warning(f"Failed to fetch form/H2H for {home_team} vs {away_team}: {form_error}")
+                logger.warning("Failed to fetch form/H2H for %s vs %s: %s", home_team, away_team, form_error)
                 match['_enrichment_status'] = 'partial_failure'
                 # Keep defaults, but mark that we tried
                 return match
                 
         except Exception as e:
-            logger.error(f"Error enriching match statistics: {e}")
+            logger.error("Error enriching match statistics: %s", e)
             match['_enrichment_status'] = 'failed'
             # Return match with defaults
             return match
         
         return match
     
+    async def _enrich_match_with_statistics_async(self, match: Dict) -> Dict:
+        """Async variant of _enrich_match_with_statistics (form and H2H fetched concurrently)"""
+        if not self.history_service:
+            logger.debug("History service not available, using defaults")
+            return match
+        
+        try:
+            context = self._enrichment_context(match)
+            if context is None:
+                return match
+            home_team, away_team, competition_code, match_date = context
+            
+            try:
+                home_form, away_form, h2h = await asyncio.gather(
+                    self.history_service.calculate_team_form_async(
+                        team_name=home_team,
+                        competition_code=competition_code,
+                        before_date=match_date,
+                        matches_needed=5
+                    ),
+                    self.history_service.calculate_team_form_async(
+                        team_name=away_team,
+                        competition_code=competition_code,
+                        before_date=match_date,
+                        matches_needed=5
+                    ),
+                    self.history_service.calculate_h2h_async(
+                        team1_name=home_team,
+                        team2_name=away_team,
+                        competition_code=competition_code,
+                        before_date=match_date,
+                        matches_needed=5
+                    )
+                )
+                self._apply_statistics(match, home_form, away_form, h2h)
+                
+            except Exception as form_error:
+                logger.warning("Failed to fetch form/H2H for %s vs %s: %s", home_team, away_team, form_error)
+                match['_enrichment_status'] = 'partial_failure'
+                return match
+                
+        except Exception as e:
+            logger.error("Error enriching match statistics: %s", e)
+            match['_enrichment_status'] = 'failed'
+            return match
+        
+        return match
+    
+    def _enrichment_context(self, match: Dict) -> Optional[Tuple[str, str, str, datetime]]:
+        """
+        Resolve (home_team, away_team, competition_code, match_date) for enrichment
+        
+        Returns None if the teams or the Football-Data.org competition can't be resolved.
+        """
+        home_team = match.get('home_team', '')
+        away_team = match.get('away_team', '')
+        league_name = match.get('league', '')
+        league_id = match.get('league_id')  # May not be set
+        match_date = match.get('match_date') or datetime.now()
+        
+        if not home_team or not away_team:
+            logger.warning("Missing team names, skipping enrichment: %s vs %s", home_team, away_team)
+            return None
+        
+        # Get competition code for Football-Data.org
+        competition_code = self.history_service.get_competition_code(
+            league_id=league_id,
+            league_name=league_name
+        )
+        
+        if not competition_code:
+            logger.warning("⚠️ Could not map league '%s' (ID: %s) to Football-Data.org code, using defaults", league_name, league_id)
+            logger.warning("   Available mappings: %s", list(self.history_service.LEAGUE_MAPPING.keys()))
+            return None
+        
+        logger.info("✅ Mapped league '%s' (ID: %s) to competition code: %s", league_name, league_id, competition_code)
+        
+        logger.info("Enriching %s vs %s (%s)", home_team, away_team, competition_code)
+        
+        return home_team, away_team, competition_code, match_date
+    
+    def _apply_statistics(self, match: Dict, home_form: Dict, away_form: Dict, h2h: Dict):
+        """Write fetched form/H2H (and xG derived from form) into the match"""
+        # Calculate real xG from form
+        home_xg = self.history_service.calculate_xg_from_form(home_form, is_home=True)
+        away_xg = self.history_service.calculate_xg_from_form(away_form, is_home=False)
+        
+        # Update match with real data
+        match['home_form'] = {
+            'goals_scored_5': home_form.get('goals_scored_5', 0),
+            'goals_conceded_5': home_form.get('goals_conceded_5', 0),
+            'form_percentage': home_form.get('form_percentage', 0.5),
+            'wins': home_form.get('wins', 0),
+            'draws': home_form.get('draws', 0),
+            'losses': home_form.get('losses', 0),
+            'form_string': home_form.get('form_string', ''),
+            'points_5': home_form.get('points_5', 0),
+            'clean_sheets': home_form.get('clean_sheets', 0),
+            'matches_count': home_form.get('matches_count', 0),
+            'avg_goals_scored': home_form.get('avg_goals_scored', 0.0),
+            'avg_goals_conceded': home_form.get('avg_goals_conceded', 0.0),
+            'shots_on_target_avg': home_form.get('avg_goals_scored', 0.0) * 2.5,  # Estimate SOT from goals
+            'goals_variance': abs(home_form.get('avg_goals_scored', 1.5) - 1.5) * 2  # Estimate variance
+        }
+        
+        match['away_form'] = {
+            'goals_scored_5': away_form.get('goals_scored_5', 0),
+            'goals_conceded_5': away_form.get('goals_conceded_5', 0),
+            'form_percentage': away_form.get('form_percentage', 0.5),
+            'wins': away_form.get('wins', 0),
+            'draws': away_form.get('draws', 0),
+            'losses': away_form.get('losses', 0),
+            'form_string': away_form.get('form_string', ''),
+            'points_5': away_form.get('points_5', 0),
+            'clean_sheets': away_form.get('clean_sheets', 0),
+            'matches_count': away_form.get('matches_count', 0),
+            'avg_goals_scored': away_form.get('avg_goals_scored', 0.0),
+            'avg_goals_conceded': away_form.get('avg_goals_conceded', 0.0),
+            'shots_on_target_avg': away_form.get('avg_goals_scored', 0.0) * 2.5,
+            'goals_variance': abs(away_form.get('avg_goals_scored', 1.5) - 1.5) * 2
+        }
+        
+        match['home_xg'] = round(home_xg, 2)
+        match['away_xg'] = round(away_xg, 2)
+        
+        # Add H2H data
+        match['h2h'] = {
+            'home_wins': h2h.get('team1_wins', 0),
+            'away_wins': h2h.get('team2_wins', 0),
+            'draws': h2h.get('draws', 0),
+            'total_matches': h2h.get('total_matches', 0),
+            'avg_goals_home': h2h.get('avg_goals_team1', 0.0),
+            'avg_goals_away': h2h.get('avg_goals_team2', 0.0),
+            'recent_trend': h2h.get('recent_trend', 'unknown'),
+            'avg_total_goals': h2h.get('avg_total_goals', 0.0)
+        }
+        
+        # Mark as enriched with real data
+        match['_stats_source'] = 'football_data_org'
+        match['_enrichment_status'] = 'success'
+        
+        logger.info("✅ Enriched %s vs %s: Form=%s, H2H=%s matches", match.get('home_team'), match.get('away_team'), home_form.get('form_string', 'N/A'), h2h.get('total_matches', 0))
+    
     def _map_league_tier(self, league_id: int) -> str:
         """Map API-Football league ID to league tier"""
-        mapping = {
-            # Top tier
-            39: "EPL",
-            140: "LaLiga",
-            78: "Bundesliga",
-            135: "SerieA",
-            61: "Ligue1",
-            88: "Eredivisie",
-            # More leagues
-            203: "SuperLig",
-            235: "PremierLeague_RU",
-            179: "LigaMX",
-            262: "MLS",
-            128: "PrimeiraLiga",
-            71: "SerieA_BR",
-            299: "J1League",
-            307: "KLeague1",
-            106: "Brasileirao",
-            144: "JupilerPro",
-            89: "Ekstraklasa",
-            103: "Superliga",
-            113: "Eliteserien",
-            119: "Allsvenskan",
-            94: "SuperLeague",
-            207: "SerieA_AR",
-        }
-        return mapping.get(league_id, f"league_{league_id}")  # Return league ID if not mapped, don't exclude
+        return _LEAGUE_TIER.get(league_id) or f"league_{league_id}"  # Return league ID if not mapped, don't exclude
     
     def _get_sample_matches(self) -> List[Dict]:
         """Return sample matches for testing when API key not available"""
-        from datetime import datetime, timedelta
+        now = datetime.now()
         
         return [
             {
@@ -1028,7 +1999,7 @@ class MatchFetcher:
                 'away_team': 'Sheffield United',
                 'league': 'Premier League',
                 'league_tier': 'EPL',
-                'match_date': datetime.now(),
+                'match_date': now,
                 'home_odds': 1.20,
                 'draw_odds': 6.00,
                 'away_odds': 12.00,
@@ -1066,7 +2037,7 @@ class MatchFetcher:
                 'away_team': 'Brighton',
                 'league': 'Premier League',
                 'league_tier': 'EPL',
-                'match_date': datetime.now(),
+                'match_date': now,
                 'home_odds': 1.35,
                 'draw_odds': 5.00,
                 'away_odds': 8.00,
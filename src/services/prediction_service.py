@@ -319,14 +319,18 @@ class PredictionService:
         """Get raw ML predictions before filtering"""
         raw = []
         
-        for match in matches:
-            if not self.filter.filter_match(match):
-                continue
-            
+        matches = [match for match in matches if self.filter.filter_match(match)]
+        if not matches:
+            return raw
+        
+        # Score the whole slate in one model call
+        probs = self.predictor.predict_batch(matches)
+        
+        for match, match_prob in zip(matches, probs):
             markets = self.simulator.get_recommended_markets(match)
             
             for market in markets:
-                prob = self.predictor.predict(match, market)
+                prob = float(match_prob)
                 odds = self._get_odds_for_market(match, market, prob)
                 
                 raw.append({